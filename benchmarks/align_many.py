@@ -0,0 +1,59 @@
+# encoding: utf-8
+"""
+Compares aligning many pairs of pronunciations one at a time with
+alignPronunciations() versus in a batch with alignMany().
+
+Usage: python align_many.py [number of pairs]
+"""
+
+import random
+import sys
+import timeit
+
+from pysle import phonetics
+from pysle import pronunciationtools
+
+numPairs = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+rng = random.Random(0)
+phones = ["k", "ˈæ", "t", "ɹ", "ə", "n", "s", "d", "ˈɪ", "l", "ɚ", "m"]
+
+
+def randomPronunciation():
+    return [rng.choice(phones) for _ in range(rng.randint(2, 10))]
+
+
+pairs = [(randomPronunciation(), randomPronunciation()) for _ in range(numPairs)]
+
+oneAtATimeTime = timeit.timeit(
+    lambda: [pronunciationtools.alignPronunciations(a, b, True) for a, b in pairs],
+    number=1,
+)
+batchTime = timeit.timeit(
+    lambda: list(pronunciationtools.alignMany(pairs)),
+    number=1,
+)
+parallelTime = timeit.timeit(
+    lambda: list(pronunciationtools.alignMany(pairs, processes=2)),
+    number=1,
+)
+
+print(f"{numPairs} pairs")
+print(f"alignPronunciations():        {oneAtATimeTime:.3f}s")
+print(f"alignMany():                  {batchTime:.3f}s")
+print(f"alignMany(processes=2):       {parallelTime:.3f}s")
+
+# Pronunciations in a corpus repeat, so the same pairs come up again and again
+repeatedPairs = [rng.choice(pairs[:500]) for _ in range(numPairs)]
+uncachedTime = timeit.timeit(
+    lambda: list(pronunciationtools.alignMany(repeatedPairs)), number=1
+)
+phonetics.enableAlignmentCache()
+cachedTime = timeit.timeit(
+    lambda: list(pronunciationtools.alignMany(repeatedPairs)), number=1
+)
+phonetics.disableAlignmentCache()
+
+print(f"{numPairs} pairs, drawn from 500 distinct pairs")
+print(f"alignMany():                  {uncachedTime:.3f}s")
+print(f"alignMany(), alignment cache: {cachedTime:.3f}s")
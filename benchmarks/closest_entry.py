@@ -0,0 +1,36 @@
+# encoding: utf-8
+"""
+Times PhonemeList.findClosestEntry() for a word with many pronunciations,
+as happens for common words like 'the' or 'and' when syllabifying.
+
+Usage: python closest_entry.py
+"""
+
+import timeit
+
+from pysle import phonetics
+
+NUM_RUNS = 5_000
+
+entries = [
+    phonetics.Entry("and", [syllabification], ["cc"])
+    for syllabification in [
+        [["ˈæ", "n", "d"]],
+        [["ə", "n", "d"]],
+        [["ə", "n"]],
+        [["n̩"]],
+        [["ˈɛ", "n", "d"]],
+        [["ɪ", "n", "d"]],
+        [["ˈæ", "n"]],
+        [["ə", "n"], ["d", "ə"]],
+        [["ˈæ", "n", "d"], ["ə"]],
+        [["ˈɑ", "n", "t"]],
+    ]
+]
+
+for phones in [["ə", "n"], ["æ", "n", "d"], ["æ", "n", "d", "ə", "n", "d"]]:
+    phonemeList = phonetics.PhonemeList(phones)
+    runTime = timeit.timeit(
+        lambda: phonemeList.findClosestEntry(entries), number=NUM_RUNS
+    )
+    print(f"{phones}: {runTime / NUM_RUNS * 1e6:.1f}us")
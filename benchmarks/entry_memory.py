@@ -0,0 +1,32 @@
+# encoding: utf-8
+"""
+Measures the memory used by parsed entries, as held in Isle.data
+after looking up every word with Isle.lookup().
+
+Usage: python entry_memory.py [path/to/ISLEdict.txt] [number of words]
+"""
+
+import sys
+import tracemalloc
+
+from pysle import isletool
+from pysle.utilities import constants
+
+islePath = sys.argv[1] if len(sys.argv) > 1 else constants.DEFAULT_ISLE_DICT_PATH
+numWords = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+
+isle = isletool.Isle(islePath)
+words = list(isle.rawData.keys())[:numWords]
+
+tracemalloc.start()
+before = tracemalloc.take_snapshot()
+numEntries = sum(len(isle.lookup(word)) for word in words)
+after = tracemalloc.take_snapshot()
+tracemalloc.stop()
+
+totalBytes = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+print(f"Dictionary: {islePath}")
+print(f"{numEntries} entries for {len(words)} words")
+print(f"Parsed entries: {totalBytes / 1024 / 1024:.1f} MiB")
+print(f"Per entry:      {totalBytes / numEntries:.0f} bytes")
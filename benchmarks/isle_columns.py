@@ -0,0 +1,58 @@
+# encoding: utf-8
+"""
+Compares two aggregate queries (phoneme frequencies and a histogram of
+syllable counts) computed by walking Isle.getEntries() versus computed
+from Isle.toColumns().
+
+Usage: python isle_columns.py [path/to/ISLEdict.txt]
+"""
+
+import collections
+import sys
+import timeit
+
+from pysle import isletool
+from pysle.utilities import constants
+from pysle.utilities import symbol_table
+
+islePath = sys.argv[1] if len(sys.argv) > 1 else constants.DEFAULT_ISLE_DICT_PATH
+
+
+def walkEntries(isle):
+    phonemeCounts = collections.Counter()
+    syllableHistogram = collections.Counter()
+    for entry in isle.getEntries():
+        numSyllables = 0
+        for syllabification in entry.syllabificationList:
+            numSyllables += len(syllabification)
+            for syllable in syllabification.syllables:
+                phonemeCounts.update(syllable.phonemes)
+        syllableHistogram[numSyllables] += 1
+
+    return phonemeCounts, syllableHistogram
+
+
+def queryColumns(columns):
+    codeCounts = collections.Counter(columns.phonemeCodes)
+    phonemeCounts = collections.Counter(
+        {symbol_table.phonemeTable.symbols[code]: n for code, n in codeCounts.items()}
+    )
+    offsets = columns.entrySyllableOffsets
+    syllableHistogram = collections.Counter(map(int.__sub__, offsets[1:], offsets[:-1]))
+
+    return phonemeCounts, syllableHistogram
+
+
+isle = isletool.Isle(islePath)
+walkTime = timeit.timeit(lambda: walkEntries(isle), number=1)
+
+buildTime = timeit.timeit(lambda: isle.toColumns(), number=1)
+columns = isle.toColumns()
+queryTime = timeit.timeit(lambda: queryColumns(columns), number=1)
+
+assert walkEntries(isle) == queryColumns(columns)
+
+print(f"Dictionary: {islePath}")
+print(f"Walking getEntries():  {walkTime:.3f}s")
+print(f"Building toColumns():  {buildTime:.3f}s (once)")
+print(f"Querying the columns:  {queryTime:.3f}s")
@@ -0,0 +1,48 @@
+# encoding: utf-8
+"""
+Compares Isle.contains() against the old implementation, which
+looked the word up and caught WordNotInIsleError.
+
+Usage: python isle_contains.py [path/to/ISLEdict.txt]
+"""
+
+import sys
+import timeit
+
+from pysle import isletool
+from pysle.utilities import constants
+from pysle.utilities import errors
+
+NUM_WORDS = 100_000
+
+islePath = sys.argv[1] if len(sys.argv) > 1 else constants.DEFAULT_ISLE_DICT_PATH
+isle = isletool.Isle(islePath)
+
+words = list(isle.rawData.keys())
+step = max(len(words) // NUM_WORDS, 1)
+hits = words[::step][:NUM_WORDS]
+misses = [word + "_zzz" for word in hits]
+
+
+def lookupContains(word):
+    try:
+        isle.lookup(word)
+    except errors.WordNotInIsleError:
+        return False
+    else:
+        return True
+
+
+for name, wordList in (("hits", hits), ("misses", misses)):
+    # Clear parsed entries so lookup() pays the parsing cost, as on first use
+    isle.data.clear()
+    lookupTime = timeit.timeit(
+        lambda: [lookupContains(word) for word in wordList], number=1
+    )
+    containsTime = timeit.timeit(
+        lambda: [isle.contains(word) for word in wordList], number=1
+    )
+
+    print(f"{len(wordList)} {name}")
+    print(f"  lookup() + except: {lookupTime:.3f}s")
+    print(f"  contains():        {containsTime:.3f}s")
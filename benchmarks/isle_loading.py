@@ -0,0 +1,35 @@
+# encoding: utf-8
+"""
+Compares the cold start time of Isle() when reading ISLEdict.txt
+directly versus loading the compiled dictionary.
+
+Usage: python isle_loading.py [path/to/ISLEdict.txt]
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+
+from pysle.utilities import constants
+from pysle.utilities import isle_io
+
+NUM_RUNS = 5
+
+islePath = sys.argv[1] if len(sys.argv) > 1 else constants.DEFAULT_ISLE_DICT_PATH
+
+with tempfile.TemporaryDirectory() as tmpDir:
+    compiledPath = os.path.join(tmpDir, "ISLEdict.compiled")
+
+    compileTime = timeit.timeit(
+        lambda: isle_io.compileIsleDict(islePath, compiledPath), number=1
+    )
+    textTime = timeit.timeit(lambda: isle_io.readIsleDict(islePath), number=NUM_RUNS)
+    compiledTime = timeit.timeit(
+        lambda: isle_io.loadCompiledIsleDict(islePath, compiledPath), number=NUM_RUNS
+    )
+
+print(f"Dictionary: {islePath}")
+print(f"One-time compilation: {compileTime:.3f}s")
+print(f"Text parser:          {textTime / NUM_RUNS:.3f}s per load")
+print(f"Compiled dictionary:  {compiledTime / NUM_RUNS:.3f}s per load")
@@ -0,0 +1,37 @@
+# encoding: utf-8
+"""
+Measures the time and peak memory of a full pass over the dictionary,
+with and without caching the parsed entries, and with a part of speech
+filter that is applied to the raw lines before parsing.
+
+Usage: python iter_entries.py [path/to/ISLEdict.txt]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from pysle import isletool
+from pysle.utilities import constants
+
+islePath = sys.argv[1] if len(sys.argv) > 1 else constants.DEFAULT_ISLE_DICT_PATH
+
+passes = [
+    ("useCache=True", {"useCache": True}),
+    ("useCache=False", {}),
+    ("pos filter", {"wordFilter": isletool.posFilter("nn")}),
+]
+for name, kwargs in passes:
+    isle = isletool.Isle(islePath)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    numEntries = sum(1 for _ in isle.iterEntries(**kwargs))
+    runTime = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{name}: {numEntries} entries in {runTime:.3f}s, "
+        f"peak {peak / 1024 / 1024:.1f} MiB"
+    )
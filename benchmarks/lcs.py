@@ -0,0 +1,35 @@
+# encoding: utf-8
+"""
+Compares the LCS implementations used for aligning pronunciations:
+Hirschberg's algorithm (utils._lcs) and the table with a traceback
+(utils._lcsTable), for word-length and long sequences.
+
+Usage: python lcs.py
+"""
+
+import random
+import timeit
+
+from pysle.utilities import utils
+
+rng = random.Random(0)
+phones = ["k", "ˈæ", "t", "ɹ", "ə", "n", "s", "d", "ɪ", "l"]
+
+cases = [
+    ("4 x 5 phones", 4, 5, 20_000),
+    ("8 x 9 phones", 8, 9, 10_000),
+    ("15 x 12 phones", 15, 12, 5_000),
+    ("200 x 200 phones", 200, 200, 5),
+]
+
+for name, lenA, lenB, numRuns in cases:
+    xs = [rng.choice(phones) for _ in range(lenA)]
+    ys = [rng.choice(phones) for _ in range(lenB)]
+    assert utils._lcs(xs, ys) == utils._lcsTable(xs, ys)
+
+    hirschbergTime = timeit.timeit(lambda: utils._lcs(xs, ys), number=numRuns)
+    tableTime = timeit.timeit(lambda: utils._lcsTable(xs, ys), number=numRuns)
+
+    print(name)
+    print(f"  Hirschberg: {hirschbergTime / numRuns * 1e6:.1f}us")
+    print(f"  Table:      {tableTime / numRuns * 1e6:.1f}us")
@@ -0,0 +1,23 @@
+# encoding: utf-8
+"""
+Microbenchmarks for the phone classification used in alignment and
+in building syllables: PhonemeList.simplify() and Syllable().
+
+Usage: python phonetics_micro.py
+"""
+
+import timeit
+
+from pysle import phonetics
+
+NUM_RUNS = 100_000
+
+phonemes = ["ˈɛ", "k", "s", "t˺", "ɹ", "ə", "ˌdʒ", "ɝ"]
+phonemeList = phonetics.PhonemeList(phonemes)
+syllable = ["s", "t", "ɹ", "ˈɛ", "ŋ", "k", "θ"]
+
+simplifyTime = timeit.timeit(lambda: phonemeList.simplify(), number=NUM_RUNS)
+syllableTime = timeit.timeit(lambda: phonetics.Syllable(syllable), number=NUM_RUNS)
+
+print(f"simplify(), {len(phonemes)} phones: {simplifyTime / NUM_RUNS * 1e6:.2f}us")
+print(f"Syllable(), {len(syllable)} phones: {syllableTime / NUM_RUNS * 1e6:.2f}us")
@@ -0,0 +1,34 @@
+# encoding: utf-8
+"""
+Times Isle.transcribeMany() on sentences drawn from a Zipfian
+distribution of words, as in real text, and reports how often the
+transcription cache was hit.
+
+Usage: python transcribe.py [path/to/ISLEdict.txt]
+"""
+
+import random
+import sys
+import timeit
+
+from pysle import isletool
+from pysle.utilities import constants
+
+VOCABULARY_SIZE = 5_000
+NUM_SENTENCES = 20_000
+WORDS_PER_SENTENCE = 10
+
+islePath = sys.argv[1] if len(sys.argv) > 1 else constants.DEFAULT_ISLE_DICT_PATH
+isle = isletool.Isle(islePath)
+
+rng = random.Random(0)
+vocabulary = rng.sample(list(isle.rawData.keys()), VOCABULARY_SIZE)
+weights = [1 / rank for rank in range(1, VOCABULARY_SIZE + 1)]
+sentences = [
+    " ".join(rng.choices(vocabulary, weights, k=WORDS_PER_SENTENCE))
+    for _ in range(NUM_SENTENCES)
+]
+
+runTime = timeit.timeit(lambda: list(isle.transcribeMany(sentences)), number=1)
+print(f"{NUM_SENTENCES} sentences: {runTime:.3f}s")
+print(isle.getTranscriptionCacheInfo())
@@ -0,0 +1,53 @@
+# encoding: utf-8
+"""
+Compares Isle.getLength() against the old implementation, which parsed
+every entry and built lists of syllables and phones just to count them.
+
+Usage: python word_lengths.py [path/to/ISLEdict.txt]
+"""
+
+import sys
+import timeit
+
+from pysle import isletool
+from pysle.utilities import constants
+
+NUM_WORDS = 20_000
+
+islePath = sys.argv[1] if len(sys.argv) > 1 else constants.DEFAULT_ISLE_DICT_PATH
+isle = isletool.Isle(islePath)
+
+words = list(isle.rawData.keys())
+step = max(len(words) // NUM_WORDS, 1)
+words = words[::step][:NUM_WORDS]
+
+
+def entryLength(word, maxFlag):
+    syllableCountList = []
+    phoneCountList = []
+    for entry in isle.lookup(word):
+        syllableList = []
+        phoneList = []
+        for syllabification in entry.syllabificationList:
+            syllableList.extend(syllabification.syllables)
+            phoneList.extend(syllabification.desyllabify().phonemes)
+        syllableCountList.append(len(syllableList))
+        phoneCountList.append(len(phoneList))
+
+    if maxFlag is True:
+        return max(syllableCountList), max(phoneCountList)
+    return (
+        sum(syllableCountList) / float(len(syllableCountList)),
+        sum(phoneCountList) / float(len(phoneCountList)),
+    )
+
+
+def run(getLength):
+    for word in words:
+        getLength(word, False)
+
+
+for name, getLength in [("entries", entryLength), ("table", isle.getLength)]:
+    firstTime = timeit.timeit(lambda: run(getLength), number=1)
+    repeatTime = timeit.timeit(lambda: run(getLength), number=1)
+    print(f"{name}: first pass {firstTime:.3f}s, repeat pass {repeatTime:.3f}s")
@@ -1,11 +1,25 @@
 # encoding: utf-8
 """The main interface for working with the ISLE dictionary."""
 
-import copy
+import array
+import multiprocessing.pool
 import os
-from typing import List, Optional, Tuple, Iterable, Union, Dict, Generator
+from typing import (
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Iterable,
+    Union,
+    Dict,
+    Generator,
+    Mapping,
+    Callable,
+)
 from typing_extensions import Literal
 
+from pysle.utilities import cache
+from pysle.utilities import columns
 from pysle.utilities import constants
 from pysle.utilities import errors
 from pysle.utilities import utils
@@ -14,21 +28,161 @@ from pysle.utilities import isle_io
 from pysle.utilities import search
 from pysle import phonetics
 
+# The number of out-of-dictionary words to remember, so that repeated
+# lookups of them don't have to search the dictionary again
+NEGATIVE_CACHE_SIZE = 10_000
+
+# The number of words with suffixes to keep derived entries for;
+# see Isle.findBestSyllabification()
+INFLECTED_ENTRY_CACHE_SIZE = 10_000
+
+# Suffixes that can be dropped to find a word in the dictionary, and the
+# phonemes that they add to its pronunciation.  The phonemes for "'s"
+# depend on the word's final sound (see _getSuffixPhones()).  A trailing
+# apostrophe, as in the plural possessive (eg dogs'), adds nothing.
+INFLECTIONAL_SUFFIXES = {
+    "'s": None,
+    "'": [],
+    "'ll": ["l"],
+    "'d": ["d"],
+    "'ve": ["v"],
+    "'re": ["ɹ"],
+}
+
+# The number of (word, preference) pairs to keep transcriptions for;
+# see Isle.transcribe()
+TRANSCRIPTION_CACHE_SIZE = 100_000
+
+# Stress marks and spaces are dropped from transcriptions
+_TRANSCRIPTION_CLEANUP = str.maketrans("", "", "ˈˌ ")
+
+# The columns of Isle._lengths; each word that has been measured has a
+# row of LENGTH_TABLE_WIDTH values, starting at the offset in Isle._lengthRows
+LENGTH_TABLE_WIDTH = 6
+
+# Marks a word that isn't in a cache, as a word can be cached with no entries
+_MISSING = object()
+
+# Marks a word that is known not to be in the dictionary
+_MISSING_WORD = object()
+
 
 def sequenceMatch(matchChar: str, searchStr: str) -> bool:
     """Does marchChar appear in searchStr?"""
     return matchChar in searchStr
 
 
+def posFilter(pos: str) -> Callable[[str], bool]:
+    """Makes a filter for Isle.iterEntries() that keeps entries with a pos tag
+
+    Args:
+        pos: a part of speech tag, as it appears in Entry.posList e.g. 'nn'
+
+    Returns:
+        a predicate on raw isle lines
+    """
+
+    def hasPos(line: str) -> bool:
+        return pos in isle_io.getPosListFromLine(line)
+
+    return hasPos
+
+
+def multiwordFilter(multiword: Literal["ok", "only", "no"]) -> Callable[[str], bool]:
+    """Makes a filter for Isle.iterEntries() on the number of words in entries
+
+    Args:
+        multiword: if 'only', keep only multiword entries
+            (e.g. 'brown_cat'); if 'no', drop them; if 'ok', keep everything
+
+    Returns:
+        a predicate on raw isle lines
+    """
+    utils.validateOption("multiword", multiword, constants.AcceptabilityMode)
+
+    if multiword == constants.AcceptabilityMode.ONLY:
+        return lambda line: isle_io.getWordCountFromLine(line) > 1
+    if multiword == constants.AcceptabilityMode.NO:
+        return lambda line: isle_io.getWordCountFromLine(line) <= 1
+
+    return lambda line: True
+
+
+class WordLengths(NamedTuple):
+    """The number of syllables and phones in the pronunciations of a word
+
+    Each pronunciation (dictionary entry) is counted separately; for
+    multiword entries, the counts include every word.
+    """
+
+    minSyllables: float
+    maxSyllables: float
+    meanSyllables: float
+    minPhones: float
+    maxPhones: float
+    meanPhones: float
+
+
+def _measureLines(word: str, lines: Iterable[str]) -> WordLengths:
+    """Counts syllables and phones straight from a word's raw isle lines"""
+    syllableCountList = []
+    phoneCountList = []
+    for line in lines:
+        syllableCount = 0
+        phoneCount = 0
+        for syllabification in isle_io.parseIslePronunciation(word, line)[
+            "syllabificationList"
+        ]:
+            # Empty syllables are dropped, as in phonetics.Syllabification
+            for syllable in syllabification:
+                if len(syllable) > 0:
+                    syllableCount += 1
+                    phoneCount += len(syllable)
+
+        syllableCountList.append(syllableCount)
+        phoneCountList.append(phoneCount)
+
+    return WordLengths(
+        min(syllableCountList),
+        max(syllableCountList),
+        sum(syllableCountList) / float(len(syllableCountList)),
+        min(phoneCountList),
+        max(phoneCountList),
+        sum(phoneCountList) / float(len(phoneCountList)),
+    )
+
+
+def _parseEntry(word: str, line: str) -> phonetics.Entry:
+    entryAsHash = isle_io.parseIslePronunciation(word, line)
+    return phonetics.Entry(
+        entryAsHash["word"],
+        entryAsHash["syllabificationList"],
+        entryAsHash["posList"],
+    )
+
+
 class Isle:
     """The interface for working with ISLEdict.txt
 
     Pysle comes with ISLEdict.txt installed but you may specify
     a custom dictionary to search with instead.  Please see README.md
     for more information about obtaining an original copy.
+
+    Compiled copies of dictionaries are pickled, and are only read from and
+    written to the user's cache directory (see isle_io.getUserCacheDir).
+    Pysle trusts the files it finds there, so that directory must not be
+    writable by other users.
     """
 
-    def __init__(self, islePath: Optional[str] = None):
+    def __init__(
+        self,
+        islePath: Optional[str] = None,
+        useCompiledDict: bool = True,
+        backend: Literal["dict", "mmap"] = "dict",
+        persistSearchIndex: bool = False,
+        entryCacheSize: Optional[int] = None,
+        cachePolicy: Literal["lru", "fifo"] = "lru",
+    ):
         """The constructor for isle
 
         Creating an instance of Isle() will load Isle into memory
@@ -37,52 +191,250 @@ class Isle:
         Args:
             islePath: the path to an islex dictionary.  If None, the
                 original islex will be used.
+            useCompiledDict: if True, load the dictionary from a compiled
+                copy (see isle_io.loadCompiledIsleDict).  The compiled copy is
+                created or rebuilt as needed and is saved in the user's cache
+                directory (see isle_io.getCachePath).
+            backend: how the raw dictionary is held in memory. With 'dict', every
+                line is loaded into memory.  With 'mmap', a packed copy of the
+                dictionary is memory-mapped and lines are decoded on demand; the
+                pages are shared between all processes that use the same file
+                (see isle_io.loadPackedIsleDict).
+            persistSearchIndex: if True, the data prepared for search(),
+                including its n-gram index, is saved alongside the compiled
+                dictionary and reused by later instances of Isle
+            entryCacheSize: the maximum number of words to keep parsed entries
+                for.  If None, the parsed entries of every word that has been
+                looked up are kept.
+            cachePolicy: which word's entries to drop when the cache is full;
+                the least recently used ('lru') or the oldest ('fifo')
         """
+        utils.validateOption("backend", backend, constants.IsleBackend)
+        utils.validateOption("cachePolicy", cachePolicy, constants.CachePolicy)
+
         if not islePath:
             islePath = constants.DEFAULT_ISLE_DICT_PATH
         elif not os.path.exists(islePath):
             raise errors.IsleDictDoesNotExistError()
 
+        self.islePath: Optional[str] = islePath
+        self.useCompiledDict = useCompiledDict
+        self.backend = backend
+        self.persistSearchIndex = persistSearchIndex
+        self.entryCacheSize = entryCacheSize
+        self.cachePolicy = cachePolicy
         self.rawData = self._load(islePath)
-        self.data: Dict[str, List[phonetics.Entry]] = {}
+        self._initCaches()
+
+    @classmethod
+    def attachShared(
+        cls,
+        name: str,
+        entryCacheSize: Optional[int] = None,
+        cachePolicy: Literal["lru", "fifo"] = "lru",
+    ) -> "Isle":
+        """Opens an Isle that another process shared with Isle.toSharedMemory()
+
+        The dictionary is read directly from shared memory, so attaching is
+        fast and does not copy the dictionary.
+
+        Args:
+            name: the name of the shared memory block
+            entryCacheSize: see Isle()
+            cachePolicy: see Isle()
+
+        Returns:
+            an instance of Isle backed by the shared dictionary; call close()
+            on it, or use it as a context manager, when done with it
+
+        Raises:
+            SharedMemoryNotSupportedError: on Python 3.7 and older
+        """
+        utils.validateOption("cachePolicy", cachePolicy, constants.CachePolicy)
+
+        isle = cls.__new__(cls)
+        isle.islePath = None
+        isle.useCompiledDict = False
+        isle.backend = constants.IsleBackend.MMAP
+        isle.persistSearchIndex = False
+        isle.entryCacheSize = entryCacheSize
+        isle.cachePolicy = cachePolicy
+        isle.rawData = isle_io.attachSharedIsleDict(name)
+        isle._initCaches()
+
+        return isle
+
+    def toSharedMemory(self):
+        """Copies the dictionary into shared memory, for use in other processes
+
+        Child processes (e.g. in a multiprocessing.Pool) can then call
+        Isle.attachShared(sharedMemory.name) instead of loading the dictionary.
+
+        The caller owns the shared memory and should call close() and
+        unlink() on it once all processes are done with it.
+
+        Returns:
+            a multiprocessing.shared_memory.SharedMemory
+
+        Raises:
+            SharedMemoryNotSupportedError: on Python 3.7 and older
+        """
+        return isle_io.sharePackedIsleDict(self.rawData)
+
+    def close(self) -> None:
+        """Releases the memory-mapped or shared dictionary, if any
+
+        The dictionary can't be used afterwards.  Isle can also be used as
+        a context manager, which calls close() on exit.  If close() is never
+        called, the dictionary is released when the Isle is garbage collected.
+        """
+        close = getattr(self.rawData, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> "Isle":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def _initCaches(self) -> None:
+        self.data: cache.BoundedCache[str, List[phonetics.Entry]] = cache.BoundedCache(
+            self.entryCacheSize, self.cachePolicy
+        )
+        self._missingWords: cache.BoundedCache[str, object] = cache.BoundedCache(
+            NEGATIVE_CACHE_SIZE, constants.CachePolicy.LRU
+        )
+        self._inflectedEntries: cache.BoundedCache[
+            Tuple[str, str], List[phonetics.Entry]
+        ] = cache.BoundedCache(INFLECTED_ENTRY_CACHE_SIZE, constants.CachePolicy.LRU)
+        self._searchIndex: Optional[search.SearchIndex] = None
+        self._transcriptions: cache.BoundedCache[Tuple[str, Optional[str]], str] = (
+            cache.BoundedCache(TRANSCRIPTION_CACHE_SIZE, constants.CachePolicy.LRU)
+        )
+        self._lengths = array.array("d")
+        self._lengthRows: Dict[str, int] = {}
+
+    def getCacheInfo(self) -> cache.CacheInfo:
+        """Get the statistics for the cache of parsed entries
+
+        Returns:
+            a named tuple with the fields hits, misses, evictions,
+            maxsize, and currsize
+        """
+        return self.data.cacheInfo()
+
+    def getNegativeCacheInfo(self) -> cache.CacheInfo:
+        """Get the statistics for the cache of out-of-dictionary words
+
+        A hit is a lookup of a word that was already known not to be in
+        the dictionary.
+
+        Returns:
+            a named tuple with the fields hits, misses, evictions,
+            maxsize, and currsize
+        """
+        return self._missingWords.cacheInfo()
+
+    def getTranscriptionCacheInfo(self) -> cache.CacheInfo:
+        """Get the statistics for the cache of transcribed words
+
+        Returns:
+            a named tuple with the fields hits, misses, evictions,
+            maxsize, and currsize
+        """
+        return self._transcriptions.cacheInfo()
+
+    def _load(self, islePath) -> Mapping[str, List[str]]:
+        if self.backend == constants.IsleBackend.MMAP:
+            return isle_io.loadPackedIsleDict(islePath)
+
+        if self.useCompiledDict:
+            return isle_io.loadCompiledIsleDict(islePath)
 
-    def _load(self, islePath) -> Dict[str, List[str]]:
         return isle_io.readIsleDict(islePath)
 
     def _lazyLoad(self, word: str) -> List[phonetics.Entry]:
         """Fetches entries for a word; if not parsed yet, parses the original text"""
 
-        entries = self.data.get(word)
-        if not entries:
-            lazyLoadedEntries: List[phonetics.Entry] = []
+        entries = self.data.get(word, _MISSING)
+        if entries is not _MISSING:
+            return entries  # type: ignore[return-value]
 
-            lines = self.rawData.get(word)
-            if lines is None:
-                raise errors.WordNotInIsleError(word)
+        # Missing words skip the search of the dictionary; a new error is
+        # raised each time, so that no traceback or context is kept around
+        if self._missingWords.get(word) is _MISSING_WORD:
+            raise errors.WordNotInIsleError(word)
 
-            for rawIsleLine in lines:
-                entryAsHash = isle_io.parseIslePronunciation(word, rawIsleLine)
-                entry = phonetics.Entry(
-                    entryAsHash["word"],
-                    entryAsHash["syllabificationList"],
-                    entryAsHash["posList"],
-                )
-                lazyLoadedEntries.append(entry)
+        lines = self.rawData.get(word)
+        if lines is None:
+            self._missingWords[word] = _MISSING_WORD
+            raise errors.WordNotInIsleError(word)
 
-            self.data[word] = lazyLoadedEntries
-            return lazyLoadedEntries
-        else:
-            return entries
+        lazyLoadedEntries = [_parseEntry(word, rawIsleLine) for rawIsleLine in lines]
+
+        self.data[word] = lazyLoadedEntries
+        return lazyLoadedEntries
 
     def getEntries(self) -> Iterable[phonetics.Entry]:
         """Iterates through the isle dictionary
 
+        The entries are parsed as they are needed and aren't kept in the
+        cache (see iterEntries()).
+
+        Yields:
+            individual entries in alphabetical order
+        """
+        return self.iterEntries()
+
+    def iterEntries(
+        self,
+        wordFilter: Optional[Callable[[str], bool]] = None,
+        useCache: bool = False,
+    ) -> Generator[phonetics.Entry, None, None]:
+        """Iterates through the isle dictionary, parsing entries on the fly
+
+        Only one word's entries are alive at a time, so a full pass over the
+        dictionary runs in constant memory.  Entries that are already in the
+        cache are reused, without counting towards getCacheInfo().
+
+        Args:
+            wordFilter: a predicate on the raw isle line of each entry; lines
+                that fail it are skipped without being parsed.
+                See posFilter() and multiwordFilter()
+            useCache: if True, the entries of every word visited are parsed
+                and kept in the cache, as with lookup()
+
         Yields:
             individual entries in alphabetical order
         """
-        for word in self.rawData.keys():
-            for entry in self._lazyLoad(word):
-                yield entry
+        data = self.data
+        for word, lines in self.rawData.items():
+            entries = self._lazyLoad(word) if useCache else data.peek(word)
+
+            if entries is None:
+                for line in lines:
+                    if wordFilter is None or wordFilter(line):
+                        yield _parseEntry(word, line)
+            elif wordFilter is None:
+                yield from entries
+            else:
+                for line, entry in zip(lines, entries):
+                    if wordFilter(line):
+                        yield entry
+
+    def toColumns(self) -> columns.IsleColumns:
+        """Exports the whole dictionary as flat, offset-encoded arrays
+
+        The columns are built from the raw dictionary, so no entries are
+        parsed into objects or cached.  See utilities.columns.IsleColumns
+        for the layout.
+
+        Returns:
+            the entries of the dictionary, as columns, in the same order
+            as getEntries()
+        """
+        return columns.buildColumns(self.rawData.items())
 
     def lookup(self, word: str) -> List[phonetics.Entry]:
         """
@@ -107,6 +459,46 @@ class Isle:
 
         return self._lazyLoad(word)
 
+    def lookupMany(self, words: Iterable[str]) -> Dict[str, List[phonetics.Entry]]:
+        """Lookup many words at once
+
+        Each distinct word is only looked up once and words that aren't in
+        the dictionary are skipped rather than raising an error.
+
+        Args:
+            words: the words to lookup; may contain repeats
+
+        Returns:
+            a mapping from each distinct word that is in the dictionary to
+            its entries, in the order the words were first seen
+        """
+        return {
+            word: self._lazyLoad(normalizedWord)
+            for word, normalizedWord in self._normalizeMany(words).items()
+            if normalizedWord in self.rawData
+        }
+
+    def containsMany(self, words: Iterable[str]) -> Dict[str, bool]:
+        """Check if many words exist in the isle dictionary
+
+        Only the dictionary's keys are consulted, so no entries are parsed.
+
+        Args:
+            words: the words to check; may contain repeats
+
+        Returns:
+            a mapping from each distinct word to whether it is in the
+            dictionary, in the order the words were first seen
+        """
+        rawData = self.rawData
+        return {
+            word: normalizedWord in rawData
+            for word, normalizedWord in self._normalizeMany(words).items()
+        }
+
+    def _normalizeMany(self, words: Iterable[str]) -> Dict[str, str]:
+        return {word: word.lower().strip() for word in dict.fromkeys(words)}
+
     def getLength(self, word: str, maxFlag: bool) -> Tuple[float, float]:
         """
         Get the number of syllables and phones in this word
@@ -118,43 +510,96 @@ class Isle:
 
         Returns:
             a tuple containing the number of syllables and number of phones
+
+        Raises:
+            WordNotInIsleError: The word was not in the Isle dictionary
+        """
+        word = word.lower().strip()
+        row = self._lengthRows.get(word)
+        if row is None:
+            row = self._measure(word)
+
+        return self._lengthsAt(row, maxFlag)
+
+    def getLengthMany(
+        self, words: Iterable[str], maxFlag: bool
+    ) -> Dict[str, Tuple[float, float]]:
+        """Get the number of syllables and phones in many words at once
+
+        Words that aren't in the dictionary are skipped rather than
+        raising an error.
+
+        Args:
+            words: the words to lookup; may contain repeats
+            maxFlag: see getLength()
+
+        Returns:
+            a mapping from each distinct word that is in the dictionary to
+            its number of syllables and number of phones, in the order the
+            words were first seen
+        """
+        lengthRows = self._lengthRows
+        rawData = self.rawData
+
+        lengthsByWord = {}
+        for word, normalizedWord in self._normalizeMany(words).items():
+            row = lengthRows.get(normalizedWord)
+            if row is None:
+                if normalizedWord not in rawData:
+                    continue
+                row = self._measure(normalizedWord)
+            lengthsByWord[word] = self._lengthsAt(row, maxFlag)
+
+        return lengthsByWord
+
+    def getLengthStats(self, word: str) -> WordLengths:
+        """Get the min, max, and mean number of syllables and phones in a word
+
+        Args:
+            word: the word to lookup
+
+        Returns:
+            the counts over all of the word's pronunciations
+
+        Raises:
+            WordNotInIsleError: The word was not in the Isle dictionary
         """
-        phoneCount = 0.0
-        syllableCount = 0.0
+        word = word.lower().strip()
+        row = self._lengthRows.get(word)
+        if row is None:
+            row = self._measure(word)
 
-        syllableCountList = []
-        phoneCountList = []
+        return WordLengths(*self._lengths[row : row + LENGTH_TABLE_WIDTH])
+
+    def _measure(self, word: str) -> int:
+        """Adds a row for a word to the table of lengths; returns its offset
+
+        The counts come from the raw lines, so no entries are parsed into
+        objects or cached.
+        """
+        lines = self.rawData.get(word)
+        if lines is None:
+            raise errors.WordNotInIsleError(word)
 
-        entries = self.lookup(word)
-        for entry in entries:
-            syllableList = []
-            phoneList = []
-            for syllabification in entry.syllabificationList:
-                syllableList.extend(syllabification.syllables)
-                phoneList.extend(syllabification.desyllabify().phonemes)
+        row = len(self._lengths)
+        self._lengths.extend(_measureLines(word, lines))
+        self._lengthRows[word] = row
 
-            syllableCountList.append(len(syllableList))
-            phoneCountList.append(len(phoneList))
+        return row
 
-        # The average number of phones for all possible pronunciations
-        #    of this word
+    def _lengthsAt(self, row: int, maxFlag: bool) -> Tuple[float, float]:
+        lengths = self._lengths
         if maxFlag is True:
-            syllableCount += max(syllableCountList)
-            phoneCount += max(phoneCountList)
-        else:
-            syllableCount += sum(syllableCountList) / float(len(syllableCountList))
-            phoneCount += sum(phoneCountList) / float(len(phoneCountList))
+            return lengths[row + 1], lengths[row + 4]
 
-        return syllableCount, phoneCount
+        return lengths[row + 2], lengths[row + 5]
 
     def contains(self, word: str) -> bool:
-        """Check if a word exists in the isle dictionary"""
-        try:
-            self.lookup(word)
-        except errors.WordNotInIsleError:
-            return False
-        else:
-            return True
+        """Check if a word exists in the isle dictionary
+
+        Only the dictionary's keys are consulted, so no entries are parsed.
+        """
+        return word.lower().strip() in self.rawData
 
     def findBestSyllabification(
         self, word: str, phoneList: Union[phonetics.PhonemeList, List[str]]
@@ -183,39 +628,39 @@ class Isle:
         except errors.WordNotInIsleError:
             # Many words are in the dictionary but not inflected forms
             # like the possesive (eg bob's)
-            # If the word could not be found, try dropping the 's
+            # If the word could not be found, try dropping the suffix
             # and try searching again.
-            if len(word) < 2:
-                raise
-
-            head = word[:-2]
-            tail = word[-2:]
-            if tail != "'s":
-                raise
-
-            entries = self.lookup(head)
-
-            # Add the 's' sound to each word
-            # TODO: don't mutate to avoid deepcopy() call
-            modifiedIsleWordList = []
-            for entry in entries:
-                entry = copy.deepcopy(entry)
-                tailSyllabification = entry.syllabificationList[-1]
-                finalSyllable = tailSyllabification.syllables[-1]
-                lastSound = finalSyllable.phonemes[-1]
-
-                if lastSound in phonetic_constants.alveolars:
-                    finalSyllable.phonemes.append("ɪ")
-                if lastSound in phonetic_constants.unvoiced:
-                    finalSyllable.phonemes.append("s")
-                else:
-                    finalSyllable.phonemes.append("z")
-
-                modifiedIsleWordList.append(entry)
-            entries = modifiedIsleWordList
+            entries = self._lookupInflected(word)
 
         return phoneList.findBestSyllabification(entries)
 
+    def _lookupInflected(self, word: str) -> List[phonetics.Entry]:
+        """Derives the entries for a word from the word without its suffix
+
+        See INFLECTIONAL_SUFFIXES.  The derived entries are cached.
+
+        Raises:
+            WordNotInIsleError: The word doesn't have one of the suffixes
+                or the word without the suffix was not in the Isle dictionary
+        """
+        for suffix in INFLECTIONAL_SUFFIXES:
+            if len(word) >= len(suffix) and word.endswith(suffix):
+                break
+        else:
+            raise errors.WordNotInIsleError(word)
+
+        head = word[: -len(suffix)]
+        key = (head.lower().strip(), suffix)
+        derivedEntries = self._inflectedEntries.get(key)
+        if derivedEntries is None:
+            derivedEntries = [
+                entry.withSuffix(_getSuffixPhones(entry, suffix))
+                for entry in self.lookup(head)
+            ]
+            self._inflectedEntries[key] = derivedEntries
+
+        return derivedEntries
+
     def findClosestPronunciation(
         self, word: str, phoneList: Union[phonetics.PhonemeList, List[str]]
     ) -> phonetics.Entry:
@@ -231,56 +676,161 @@ class Isle:
         self,
         sentenceTxt: str,
         preference: Optional[Literal["longest", "shortest"]] = None,
+        oovPlaceholder: Optional[str] = None,
     ) -> str:
         """
         Can be used to generate a hypothetical pronunciation for a sequence of words
 
+        The transcription of each word is cached, so words that are seen
+        again aren't looked up again (see getTranscriptionCacheInfo()).
+
         Args:
             sentenceTxt: a sequence of words separated by space e.g. 'Hello world'
             preference: if 'shortest', or 'longest', the appropriate option will be
                 picked (based on phone length); otherwise, the first option will
                 be picked
+            oovPlaceholder: if not None, words that aren't in the dictionary
+                are transcribed as this string, instead of raising an error
 
         Returns:
             a sequence of IPA characters, separated by space for each word
             e.g. 'hɛloʊ wɜrld'
+
+        Raises:
+            WordNotInIsleError: A word was not in the Isle dictionary and
+                no oovPlaceholder was given
         """
 
         if preference:
             utils.validateOption("preference", preference, constants.LengthOptions)
 
-        transcribedWordsList: List[phonetics.PhonemeList] = []
-        wordList = sentenceTxt.split(" ")
-        for word in wordList:
-            entries = self.lookup(word)
+        return self._transcribe(sentenceTxt, preference, oovPlaceholder)
 
-            phoneListsOrderedByEntry = [
-                syllabification.desyllabify()
-                for entry in entries
-                for syllabification in entry.syllabificationList
-            ]
-            numPhones = [len(phoneList) for phoneList in phoneListsOrderedByEntry]
+    def transcribeMany(
+        self,
+        sentences: Iterable[str],
+        preference: Optional[Literal["longest", "shortest"]] = None,
+        oovPlaceholder: Optional[str] = None,
+    ) -> Generator[str, None, None]:
+        """Transcribes many sentences, one at a time
 
-            i = 0
-            if preference == constants.LengthOptions.SHORTEST:
-                i = numPhones.index(min(numPhones))
-            elif preference == constants.LengthOptions.LONGEST:
-                i = numPhones.index(max(numPhones))
+        The sentences are consumed lazily, so this can be used to stream
+        through a large corpus.
 
-            transcribedWordsList.append(phoneListsOrderedByEntry[i])
+        Args:
+            sentences: sequences of words separated by space
+            preference: see transcribe()
+            oovPlaceholder: see transcribe()
 
-        def cleanPron(pron):
-            for val in ["ˈ", "ˌ", " "]:
-                pron = pron.replace(val, "")
-            return pron
+        Yields:
+            the transcription of each sentence, in order
 
-        words: List[str] = [
-            " ".join(phoneList.phonemes) for phoneList in transcribedWordsList
-        ]
-        words = [cleanPron(phones) for phones in words]
+        Raises:
+            WordNotInIsleError: A word was not in the Isle dictionary and
+                no oovPlaceholder was given
+        """
+        if preference:
+            utils.validateOption("preference", preference, constants.LengthOptions)
+
+        for sentenceTxt in sentences:
+            yield self._transcribe(sentenceTxt, preference, oovPlaceholder)
+
+    def _transcribe(
+        self,
+        sentenceTxt: str,
+        preference: Optional[str],
+        oovPlaceholder: Optional[str],
+    ) -> str:
+        transcriptions = self._transcriptions
+
+        words: List[str] = []
+        for word in sentenceTxt.split(" "):
+            word = word.lower().strip()
+            transcription = transcriptions.get((word, preference))
+            if transcription is None:
+                try:
+                    transcription = self._transcribeWord(word, preference)
+                except errors.WordNotInIsleError:
+                    if oovPlaceholder is None:
+                        raise
+                    transcription = oovPlaceholder
+
+            words.append(transcription)
 
         return " ".join(words)
 
+    def _transcribeWord(self, word: str, preference: Optional[str]) -> str:
+        """Transcribes a normalized word and caches the result"""
+        entries = self._lazyLoad(word)
+
+        phoneListsOrderedByEntry = [
+            syllabification.desyllabify()
+            for entry in entries
+            for syllabification in entry.syllabificationList
+        ]
+        numPhones = [len(phoneList) for phoneList in phoneListsOrderedByEntry]
+
+        i = 0
+        if preference == constants.LengthOptions.SHORTEST:
+            i = numPhones.index(min(numPhones))
+        elif preference == constants.LengthOptions.LONGEST:
+            i = numPhones.index(max(numPhones))
+
+        transcription = "".join(phoneListsOrderedByEntry[i].phonemes).translate(
+            _TRANSCRIPTION_CLEANUP
+        )
+        self._transcriptions[(word, preference)] = transcription
+
+        return transcription
+
+    def _getSearchIndex(self) -> search.SearchIndex:
+        """Prepares the data for searching; this is only done once per Isle"""
+        if self._searchIndex is not None:
+            return self._searchIndex
+
+        searchIndexPath = None
+        if self.persistSearchIndex and self.islePath is not None:
+            searchIndexPath = isle_io.getCachePath(
+                self.islePath, constants.SEARCH_INDEX_EXT
+            )
+            self._searchIndex = isle_io.loadCompiledObject(
+                self.islePath, searchIndexPath, search.SEARCH_INDEX_FORMAT
+            )
+            if self._searchIndex is not None:
+                return self._searchIndex
+
+        wordInfoList = []
+        for word, lines in self.rawData.items():
+            for line in lines:
+                posStart = line.find("(")
+                posEnd = line.find(")", posStart)
+                wordStart = line.find("#", posEnd)
+
+                posList = line[posStart + 1 : posEnd]
+                wordInfoList.append(
+                    {
+                        "word": word,
+                        "posList": posList,
+                        "pronunciation": line[wordStart:],
+                    }
+                )
+        self._searchIndex = search.SearchIndex(wordInfoList)
+
+        if searchIndexPath is not None:
+            # Saved with the n-gram index, so that it isn't rebuilt on reload
+            self._searchIndex.buildNgramIndex()
+            try:
+                isle_io.saveCompiledObject(
+                    self._searchIndex,
+                    self.islePath,
+                    searchIndexPath,
+                    search.SEARCH_INDEX_FORMAT,
+                )
+            except OSError:
+                pass
+
+        return self._searchIndex
+
     def search(
         self,
         searchString: str,
@@ -293,6 +843,9 @@ class Isle:
         pos: Optional[str] = None,
         exactMatch: bool = False,
         randomize: bool = False,
+        workers: Optional[int] = None,
+        ordered: bool = True,
+        pool: Optional[multiprocessing.pool.Pool] = None,
     ) -> Generator[Dict[str, str], None, None]:
         """Search for isledict entries based on pronunciation
 
@@ -332,31 +885,24 @@ class Isle:
                  syllable markers, etc)
             randomize: randomize the search order (useful if you are only looking for
                 a few results)
+            workers: if more than one, split the entries across this many
+                worker processes and yield the matches as they come back
+            ordered: only used with workers; if False, yield matches in
+                whatever order the workers finish them, rather than in
+                dictionary order
+            pool: a multiprocessing.Pool to run the search on, so that many
+                searches can share one pool instead of starting a new one each
+                time; workers should then be the number of processes in the
+                pool (if None, os.cpu_count() is assumed)
 
         Returns:
-            a generator for iterating through results
+            a generator for iterating through results; each result is a new
+            dict with the word, posList, and pronunciation of an entry
 
         """
 
-        # Prep the data for searching
-        wordInfoList = []
-        for word, lines in self.rawData.items():
-            for line in lines:
-                posStart = line.find("(")
-                posEnd = line.find(")", posStart)
-                wordStart = line.find("#", posEnd)
-
-                posList = line[posStart + 1 : posEnd]
-                wordInfoList.append(
-                    {
-                        "word": word,
-                        "posList": posList,
-                        "pronunciation": line[wordStart:],
-                    }
-                )
-
         for matchedWordInfo in search.search(
-            wordInfoList,
+            self._getSearchIndex(),
             searchString,
             numSyllables,
             wordInitial,
@@ -367,10 +913,30 @@ class Isle:
             pos,
             exactMatch,
             randomize,
+            workers,
+            ordered,
+            pool,
         ):
             yield matchedWordInfo
 
 
+def _getSuffixPhones(entry: phonetics.Entry, suffix: str) -> List[str]:
+    suffixPhones = INFLECTIONAL_SUFFIXES[suffix]
+    if suffixPhones is not None:
+        return suffixPhones
+
+    lastSound = entry.syllabificationList[-1].syllables[-1].phonemes[-1]
+    suffixPhones = []
+    if lastSound in phonetic_constants.alveolars:
+        suffixPhones.append("ɪ")
+    if lastSound in phonetic_constants.unvoiced:
+        suffixPhones.append("s")
+    else:
+        suffixPhones.append("z")
+
+    return suffixPhones
+
+
 def autopair(isle: Isle, words: List[str]) -> Tuple[List[List[str]], List[int]]:
     """
     Joins adjacent words, if their combination is in the
@@ -404,7 +970,7 @@ def autopair(isle: Isle, words: List[str]) -> Tuple[List[List[str]], List[int]]:
     sentenceList = []
     indexList = []
     for word, i in newWordList:
-        if word in isle.rawData:
+        if isle.contains(word):
             sentenceList.append(
                 words[:i]
                 + [
@@ -421,12 +987,9 @@ def findOODWords(isle: Isle, wordList: List[str]) -> List[str]:
     """
     Returns all of the unique out-of-dictionary words found in a list
     """
-    oodList = []
-    for word in wordList:
-        if not isle.contains(word):
-            oodList.append(word)
-
-    oodList = list(set(oodList))
+    oodList = [
+        word for word, isFound in isle.containsMany(wordList).items() if not isFound
+    ]
     oodList.sort()
 
     return oodList
@@ -2,32 +2,94 @@
 """Data types for representing Isle dictionaries entries and pronunciations
 """
 
+import array
+import functools
 import re
-from typing import List, Optional, Tuple, Union, TypeVar
+from typing import Any, Dict, List, Optional, Tuple, Union, TypeVar
 from abc import ABC
 
 from typing_extensions import Literal
 
+from pysle.utilities import cache
 from pysle.utilities import errors
 from pysle.utilities import constants
 from pysle.utilities import phonetic_constants
+from pysle.utilities import symbol_table
 from pysle.utilities import utils
 
 
+# Phones are classified the first time they are seen; after that,
+# classifying them is a cache lookup.  Each cache remembers at most this
+# many phones (see getPhoneCacheInfo() and clearPhoneCaches())
+PHONE_CACHE_SIZE = 4096
+
+# The default number of alignments to remember; see enableAlignmentCache()
+ALIGNMENT_CACHE_SIZE = 10_000
+
+# Maps (phonesA, phonesB, simplifiedMatching) to the aligned phones
+_alignmentCache: Optional[
+    cache.BoundedCache[
+        Tuple[Tuple[str, ...], Tuple[str, ...], bool],
+        Tuple[Tuple[str, ...], Tuple[str, ...]],
+    ]
+] = None
+
+
+@functools.lru_cache(maxsize=PHONE_CACHE_SIZE)
 def isVowel(char: str) -> bool:
     return any([vowel in char for vowel in phonetic_constants.vowelList])
 
 
+@functools.lru_cache(maxsize=PHONE_CACHE_SIZE)
 def isRhotic(char: str) -> bool:
     return any([rhotic in char for rhotic in phonetic_constants.rhotics])
 
 
+@functools.lru_cache(maxsize=PHONE_CACHE_SIZE)
+def _simplifyPhone(phone: str) -> str:
+    """See AbstractPhonemeList.simplify()"""
+    simplifiedPhone = phone
+    for diacritic in phonetic_constants.diacriticList:
+        simplifiedPhone = simplifiedPhone.replace(diacritic, "")
+
+    simplifiedPhone = simplifiedPhone.lower()
+    if isRhotic(simplifiedPhone):  # Unify rhotics
+        return "r"
+    elif isVowel(simplifiedPhone):
+        return "V"
+
+    return simplifiedPhone[0]
+
+
+def getPhoneCacheInfo() -> Dict[str, Any]:
+    """Get the hit and miss statistics of the phone classification caches
+
+    Returns:
+        a named tuple with the fields hits, misses, maxsize, and currsize
+        for each of 'isVowel', 'isRhotic', and 'simplify'
+    """
+    return {
+        "isVowel": isVowel.cache_info(),
+        "isRhotic": isRhotic.cache_info(),
+        "simplify": _simplifyPhone.cache_info(),
+    }
+
+
+def clearPhoneCaches() -> None:
+    """Empty the phone classification caches and reset their statistics"""
+    isVowel.cache_clear()
+    isRhotic.cache_clear()
+    _simplifyPhone.cache_clear()
+
+
 T = TypeVar("T", bound="AbstractPhonemeList")
 
 
 class AbstractPhonemeList(ABC):
     """Base class for a list of phonemes"""
 
+    __slots__ = ("phonemes",)
+
     def __init__(self, phonemes: List[str]):
         if any([len(phone) == 0 for phone in phonemes]):
             raise errors.NullPhoneError()
@@ -43,6 +105,24 @@ class AbstractPhonemeList(ABC):
 
         return self.phonemes == other.phonemes
 
+    # Classes with __slots__ need these to be pickled with protocols 0 and 1.
+    # Only the phonemes are saved; subclasses recompute anything derived
+    # from them when they are loaded
+    def __getstate__(self):
+        return {"phonemes": self.phonemes}
+
+    def __setstate__(self, state):
+        self.__init__(state["phonemes"])  # type: ignore[misc]
+
+    @property
+    def codes(self) -> array.array:
+        """The phonemes as codes from symbol_table.phonemeTable
+
+        Phonemes that aren't in the table are given symbol_table.UNKNOWN_CODE,
+        rather than being added to the table that the dictionary is read with.
+        """
+        return symbol_table.phonemeTable.encode(self.phonemes, addMissing=False)
+
     def stripDiacritics(self: T) -> T:
         """Removes diacritics from phones"""
         # TODO: make more comprehensive
@@ -56,22 +136,7 @@ class AbstractPhonemeList(ABC):
         - Unifies vowels and rhotics
         - Reduces all phonemes to one character
         """
-        simplifiedPhones: List[str] = []
-        for phone in self.phonemes:
-            for diacritic in phonetic_constants.diacriticList:
-                phone = phone.replace(diacritic, "")
-
-            phone = phone.lower()
-            if isRhotic(phone):  # Unify rhotics
-                phone = "r"
-            elif isVowel(phone):
-                phone = "V"
-            else:
-                phone = phone[0]
-
-            simplifiedPhones.append(phone)
-
-        return type(self)(simplifiedPhones)
+        return type(self)([_simplifyPhone(phone) for phone in self.phonemes])
 
 
 class PhonemeList(AbstractPhonemeList):
@@ -81,6 +146,8 @@ class PhonemeList(AbstractPhonemeList):
         phonemes: The list of phonemes
     """
 
+    __slots__ = ()
+
     def __add__(self, other: "PhonemeList"):
         return PhonemeList(self.phonemes + other.phonemes)
 
@@ -197,35 +264,17 @@ class PhonemeList(AbstractPhonemeList):
             UnexpectedError: hopefully you should never see this
         """
 
-        def _undoSimplification(
-            rawPhones: List[str], phonemeList: "PhonemeList"
-        ) -> "PhonemeList":
-            rawPhones = rawPhones[:]
-            return PhonemeList(
-                [
-                    rawPhones.pop(0)
-                    if phon != phonetic_constants.FILLER
-                    else phonetic_constants.FILLER
-                    for phon in phonemeList.phonemes
-                ]
-            )
-
-        if simplifiedMatching:
-            alignedSelf, alignedTarget = self.simplify()._align(
-                targetPhoneList.simplify()
-            )
-            alignedSelf = _undoSimplification(self.phonemes, alignedSelf)
-            alignedTarget = _undoSimplification(targetPhoneList.phonemes, alignedTarget)
-        else:
-            alignedSelf, alignedTarget = self._align(targetPhoneList)
+        alignedSelf, alignedTarget = alignPhones(
+            self.phonemes, targetPhoneList.phonemes, simplifiedMatching
+        )
 
         if len(alignedSelf) != len(alignedTarget):
             raise errors.UnexpectedError(
                 "Source and target phone lengths are different but should be the same. "
-                f"({alignedSelf.phonemes}), ({alignedTarget.phonemes}).  Please report to the developers."
+                f"({alignedSelf}), ({alignedTarget}).  Please report to the developers."
             )
 
-        return alignedSelf, alignedTarget
+        return PhonemeList(alignedSelf), PhonemeList(alignedTarget)
 
     def _findClosestEntry(self, entries: List["Entry"]) -> Tuple["Entry", "Entry"]:
         """Finds the closest Entry out of those in a list to the current PhonemeList
@@ -233,6 +282,9 @@ class PhonemeList(AbstractPhonemeList):
         Entries are first aligned with this PhonemeList. The entry with the fewest
         number of changes needed in alignment is considered to be the closest entry.
 
+        Only the closest entry is adjusted to the source PhonemeList, so an
+        entry that loses can't raise TooManyVowelsInSyllableError.
+
         Args:
             entries: the entries to search through
 
@@ -242,43 +294,58 @@ class PhonemeList(AbstractPhonemeList):
 
         Raises:
             FeatureNotYetAvailableError: For multi-word entries
+            TooManyVowelsInSyllableError: If adjusting the closest entry puts
+                two vowels in one syllable
         """
-        numDiffList: List[int] = []
-        withStress: List[bool] = []
-
-        modifiedSyllabificationLists: List[Syllabification] = []
-        targetPhoneListCandidates: List[PhonemeList] = []
+        # TODO: Add support for multi-word entries (seems tedious for little benefit?)
         for entry in entries:
-            # TODO: Add support for multi-word entries (seems tedious for little benefit?)
             if len(entry.syllabificationList) > 1:
                 raise errors.FeatureNotYetAvailableError(
                     "findClosestEntry does not support multi-word lookup (yet).  Please file an issue to bump priority."
                 )
 
-            targetSyllabification = entry.syllabificationList[0]
-            adjustedPhoneList, adjustedTargetPhoneList = self.align(
-                targetSyllabification.desyllabify(), simplifiedMatching=True
+        # Score the entries by how many blanks aligning them would take.
+        # Every length difference takes a blank, so an entry whose length
+        # differs by more than the best score so far can't win and isn't
+        # aligned.  Ties are kept, since they are broken by stress.
+        scoredIndicies: List[int] = []
+        numDiffList: List[int] = []
+        withStress: List[bool] = []
+        bestNumDiff: Optional[int] = None
+        for i, entry in enumerate(entries):
+            targetPhones = entry.syllabificationList[0].desyllabify().phonemes
+            if (
+                bestNumDiff is not None
+                and abs(len(self.phonemes) - len(targetPhones)) > bestNumDiff
+            ):
+                continue
+
+            numDiff = _countAlignmentDiffs(
+                self.phonemes, targetPhones, simplifiedMatching=True
             )
+            if bestNumDiff is None or numDiff < bestNumDiff:
+                bestNumDiff = numDiff
 
-            numDiff = adjustedPhoneList.phonemes.count(phonetic_constants.FILLER)
-            numDiff += adjustedTargetPhoneList.phonemes.count(phonetic_constants.FILLER)
+            scoredIndicies.append(i)
             numDiffList.append(numDiff)
-
             withStress.append(entry.hasStress)
 
-            modifiedSyllabificationLists.append(
-                targetSyllabification._postAlignAdjustment(adjustedTargetPhoneList)
-            )
-
         bestIndex = _chooseMostSimilarWithStress(numDiffList, withStress)
 
         if bestIndex is None:
             raise errors.ClosestEntryError(
                 "Unexpected error: Could not choose a closest pronunciation."
             )
-        closestEntry = entries[bestIndex]
+        closestEntry = entries[scoredIndicies[bestIndex]]
 
-        modifiedTargetSyllabification = modifiedSyllabificationLists[bestIndex]
+        # Only the closest entry needs to be adjusted to this PhonemeList
+        targetSyllabification = closestEntry.syllabificationList[0]
+        _, adjustedTargetPhoneList = self.align(
+            targetSyllabification.desyllabify(), simplifiedMatching=True
+        )
+        modifiedTargetSyllabification = targetSyllabification._postAlignAdjustment(
+            adjustedTargetPhoneList
+        )
         constructedEntry = Entry(
             closestEntry.word, [modifiedTargetSyllabification], closestEntry.posList
         )
@@ -290,53 +357,10 @@ class PhonemeList(AbstractPhonemeList):
     ) -> Tuple["PhonemeList", "PhonemeList"]:
         """See PhonemeList.align()"""
 
-        # Remove any elements not in the other list (but maintain order)
-        pronATmp = self.phonemes[:]
-        pronBTmp = targetPhoneList.phonemes[:]
-
-        # Find the longest sequence
-        sequence = utils._lcs(pronBTmp, pronATmp)
-
-        # Find the index of the sequence
-        # TODO: investigate ambiguous cases
-        startA = 0
-        startB = 0
-        sequenceIndexListA = []
-        sequenceIndexListB = []
-        for phone in sequence:
-            startA = pronATmp.index(phone, startA)
-            startB = pronBTmp.index(phone, startB)
-
-            sequenceIndexListA.append(startA)
-            sequenceIndexListB.append(startB)
-
-            startA += 1
-            startB += 1
-
-        # An index on the tail of both will be used to create output strings
-        # of the same length
-        sequenceIndexListA.append(len(pronATmp))
-        sequenceIndexListB.append(len(pronBTmp))
-
-        # Fill in any blanks such that the sequential items have the same
-        # index and the two strings are the same length
-        for i, _ in enumerate(sequenceIndexListA):
-            indexA = sequenceIndexListA[i]
-            indexB = sequenceIndexListB[i]
-            if indexA < indexB:
-                for _ in range(indexB - indexA):
-                    pronATmp.insert(indexA, phonetic_constants.FILLER)
-                sequenceIndexListA = [
-                    val + indexB - indexA for val in sequenceIndexListA
-                ]
-            elif indexA > indexB:
-                for _ in range(indexA - indexB):
-                    pronBTmp.insert(indexB, phonetic_constants.FILLER)
-                sequenceIndexListB = [
-                    val + indexA - indexB for val in sequenceIndexListB
-                ]
-
-        return type(self)(pronATmp), type(self)(pronBTmp)
+        alignedSelf, alignedTarget = _alignPhones(
+            self.phonemes, targetPhoneList.phonemes
+        )
+        return type(self)(alignedSelf), type(self)(alignedTarget)
 
 
 class Syllable(AbstractPhonemeList):
@@ -352,15 +376,31 @@ class Syllable(AbstractPhonemeList):
             vowel can't be detected
     """
 
-    def __init__(self, phonemes: List[str]):
-        self.cvList = ["V" if isVowel(phone) else "C" for phone in phonemes]
+    # The consonant/vowel structure is kept as a bitmask, where bit i is
+    # set if phoneme i is a vowel
+    __slots__ = ("_vowelMask",)
 
-        vowelCount = self.cvList.count("V")
-        if vowelCount > 1:
-            raise errors.TooManyVowelsInSyllableError(phonemes, self.cvList)
+    def __init__(self, phonemes: List[str]):
+        vowelMask = 0
+        for i, phone in enumerate(phonemes):
+            if isVowel(phone):
+                vowelMask |= 1 << i
+        self._vowelMask = vowelMask
+
+        # A mask with more than one bit set has more than one vowel
+        if vowelMask & (vowelMask - 1):
+            raise errors.TooManyVowelsInSyllableError(
+                phonemes, ["V" if isVowel(phone) else "C" for phone in phonemes]
+            )
 
         super(Syllable, self).__init__(phonemes)
 
+    @property
+    def cvList(self) -> List[str]:
+        return [
+            "V" if self._vowelMask >> i & 1 else "C" for i in range(len(self.phonemes))
+        ]
+
     @property
     def hasStress(self) -> bool:
         for phone in self.phonemes:
@@ -377,18 +417,43 @@ class Syllable(AbstractPhonemeList):
 
         return False
 
+    def withSuffix(self, suffix: List[str]) -> "Syllable":
+        """Returns a copy of this syllable with phonemes added to the end
+
+        Only the suffix is checked for vowels; this syllable's vowels are
+        already known.
+
+        Raises:
+            TooManyVowelsInSyllableError: the suffix adds a vowel to a
+                syllable that already has one
+        """
+        vowelMask = self._vowelMask
+        for i, phone in enumerate(suffix, len(self.phonemes)):
+            if isVowel(phone):
+                vowelMask |= 1 << i
+
+        phonemes = self.phonemes + suffix
+        if vowelMask & (vowelMask - 1):
+            raise errors.TooManyVowelsInSyllableError(
+                phonemes,
+                ["V" if vowelMask >> i & 1 else "C" for i in range(len(phonemes))],
+            )
+
+        syllable = Syllable.__new__(Syllable)
+        syllable.phonemes = phonemes
+        syllable._vowelMask = vowelMask
+
+        return syllable
+
     @property
     def nucleus(self) -> Optional[str]:
         """Typically the vowel in a syllable"""
-        vowelCount = self.cvList.count("V")
-
-        stressI: Optional[int]
-        if vowelCount == 1:
-            stressI = self.cvList.index("V")
-            return self.phonemes[stressI]
-        else:
+        # Only syllables with exactly one vowel have a nucleus
+        if self._vowelMask == 0 or self._vowelMask & (self._vowelMask - 1):
             return None
 
+        return self.phonemes[self._vowelMask.bit_length() - 1]
+
 
 class Syllabification:
     """Representation of athe phones in an utterance, divided into syllables
@@ -400,6 +465,15 @@ class Syllabification:
             stress
     """
 
+    __slots__ = (
+        "syllables",
+        "stressedSyllableIndicies",
+        "stressedVowelIndicies",
+        "_phonemeList",
+        "_hasStress",
+        "_stress",
+    )
+
     def __init__(
         self,
         syllables: Union[List[Syllable], List[List[str]]],
@@ -426,6 +500,11 @@ class Syllabification:
             stressedVowelIndicies if stressedVowelIndicies is not None else []
         )
 
+        # Derived values are computed on first use
+        self._phonemeList: Optional[PhonemeList] = None
+        self._hasStress: Optional[bool] = None
+        self._stress: Optional[List[int]] = None
+
     @classmethod
     def new(_cls, syllables: Union[List[Syllable], List[List[str]]]):
         """Overloaded constructor for Syllabification
@@ -454,37 +533,80 @@ class Syllabification:
 
         return isEqual
 
+    # The cached derived values aren't pickled
+    def __getstate__(self):
+        return {
+            "syllables": self.syllables,
+            "stressedSyllableIndicies": self.stressedSyllableIndicies,
+            "stressedVowelIndicies": self.stressedVowelIndicies,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(  # type: ignore[misc]
+            state["syllables"],
+            state["stressedSyllableIndicies"],
+            state["stressedVowelIndicies"],
+        )
+
     @property
     def hasStress(self) -> bool:
-        for syllable in self.syllables:
-            if syllable.hasStress:
-                return True
+        if self._hasStress is None:
+            self._hasStress = any(syllable.hasStress for syllable in self.syllables)
 
-        return False
+        return self._hasStress
 
     @property
     def stress(self) -> List[int]:
         # TODO: Why do we have this property and stressedSyllableIndicies?
-        stressList = []
-        for i, syllable in enumerate(self.syllables):
-            if syllable.hasStress:
-                stressList.append(i)
+        if self._stress is None:
+            stressList = []
+            for i, syllable in enumerate(self.syllables):
+                if syllable.hasStress:
+                    stressList.append(i)
+
+            for j, syllable in enumerate(self.syllables):
+                if syllable.hasSecondaryStress:
+                    stressList.append(j)
+
+            self._stress = stressList
 
-        for j, syllable in enumerate(self.syllables):
-            if syllable.hasSecondaryStress:
-                stressList.append(j)
+        return list(self._stress)
 
-        return stressList
+    def withSuffix(self, suffix: List[str]) -> "Syllabification":
+        """Returns a copy of this syllabification with phonemes added to the end
+
+        A suffix without a vowel (e.g. the 'z' in "cat's") is added to the
+        final syllable.  A suffix with a vowel (e.g. the 'ɪ z' in "bus's")
+        becomes a syllable of its own, so that the final syllable keeps its
+        nucleus.
+        """
+        if any(isVowel(phone) for phone in suffix):
+            syllables = self.syllables + [Syllable(suffix)]
+        else:
+            syllables = self.syllables[:-1] + [self.syllables[-1].withSuffix(suffix)]
+
+        return Syllabification(
+            syllables,
+            self.stressedSyllableIndicies,
+            self.stressedVowelIndicies,
+        )
 
     def toList(self) -> List[List[str]]:
         """Syllabification in plain list representation"""
         return [syllable.phonemes for syllable in self.syllables]
 
     def desyllabify(self) -> PhonemeList:
-        """Down convert this Syllabification to a PhonemeList"""
-        return PhonemeList(
-            [phone for syllable in self.syllables for phone in syllable.phonemes]
-        )
+        """Down convert this Syllabification to a PhonemeList
+
+        The PhonemeList is built once and shared by later calls, so it
+        shouldn't be modified.
+        """
+        if self._phonemeList is None:
+            self._phonemeList = PhonemeList(
+                [phone for syllable in self.syllables for phone in syllable.phonemes]
+            )
+
+        return self._phonemeList
 
     def stretch(self, targetSyllabification: "Syllabification") -> "Syllabification":
         """Lengthen the source syllabification based on a target syllabification
@@ -566,6 +688,8 @@ class Entry:
         hasStress: True if the syllabification in this entry contains stress
     """
 
+    __slots__ = ("word", "syllabificationList", "posList", "_phonemeList", "_hasStress")
+
     def __init__(
         self,
         word: str,
@@ -579,6 +703,10 @@ class Entry:
         ]
         self.posList = posList
 
+        # Derived values are computed on first use
+        self._phonemeList: Optional[PhonemeList] = None
+        self._hasStress: Optional[bool] = None
+
     def __eq__(self, other):
         if not isinstance(other, Entry):
             return False
@@ -590,21 +718,64 @@ class Entry:
 
         return isEqual
 
+    def __getstate__(self):
+        return {
+            "word": self.word,
+            "syllabificationList": self.syllabificationList,
+            "posList": self.posList,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(  # type: ignore[misc]
+            state["word"], state["syllabificationList"], state["posList"]
+        )
+
     @property
     def hasStress(self) -> bool:
-        for syllabification in self.syllabificationList:
-            if syllabification.hasStress:
-                return True
+        if self._hasStress is None:
+            self._hasStress = any(
+                syllabification.hasStress
+                for syllabification in self.syllabificationList
+            )
 
-        return False
+        return self._hasStress
 
     @property
     def phonemeList(self) -> PhonemeList:
-        phoneList = PhonemeList([])
-        for syllabification in self.syllabificationList:
-            phoneList = phoneList + syllabification.desyllabify()
+        """The phonemes of every word in this entry
 
-        return phoneList
+        The PhonemeList is built once and shared, so it shouldn't be modified.
+        """
+        if self._phonemeList is None:
+            self._phonemeList = PhonemeList(
+                [
+                    phone
+                    for syllabification in self.syllabificationList
+                    for phone in syllabification.desyllabify().phonemes
+                ]
+            )
+
+        return self._phonemeList
+
+    def withSuffix(self, suffix: List[str]) -> "Entry":
+        """Returns a copy of this entry with phonemes added to the end
+
+        The phonemes are added to the final word; see
+        Syllabification.withSuffix().
+        This entry is left unchanged; the copy shares its unchanged parts.
+
+        Args:
+            suffix: the phonemes to add (e.g. ['z'] for a possessive)
+
+        Returns:
+            the new entry
+        """
+        return Entry(
+            self.word,
+            self.syllabificationList[:-1]
+            + [self.syllabificationList[-1].withSuffix(suffix)],
+            self.posList,
+        )
 
     def toList(self) -> List[List[List[str]]]:
         return [
@@ -687,6 +858,185 @@ class Entry:
         return (closestEntry, constructedEntry)
 
 
+def enableAlignmentCache(maxsize: Optional[int] = ALIGNMENT_CACHE_SIZE) -> None:
+    """Remember the results of aligning phone lists
+
+    When the same pairs of pronunciations are aligned over and over
+    (e.g. when syllabifying a corpus), they only need to be aligned once.
+    The cache is off by default.  Enabling it again empties it.
+
+    Args:
+        maxsize: the maximum number of alignments to remember; the least
+            recently used are dropped first.  If None, the cache is unbounded.
+    """
+    global _alignmentCache
+    _alignmentCache = cache.BoundedCache(maxsize, constants.CachePolicy.LRU)
+
+
+def disableAlignmentCache() -> None:
+    """Stop remembering alignments and drop those remembered so far"""
+    global _alignmentCache
+    _alignmentCache = None
+
+
+def getAlignmentCacheInfo() -> Optional[cache.CacheInfo]:
+    """Get the statistics for the alignment cache
+
+    Returns:
+        a named tuple with the fields hits, misses, evictions, maxsize,
+        and currsize; or None if the cache isn't enabled
+    """
+    if _alignmentCache is None:
+        return None
+
+    return _alignmentCache.cacheInfo()
+
+
+def alignPhones(
+    phonesA: List[str], phonesB: List[str], simplifiedMatching: bool
+) -> Tuple[List[str], List[str]]:
+    """Align two lists of phones; see PhonemeList.align()
+
+    This works on plain lists, without building intermediate PhonemeLists.
+    If enabled, results come from the alignment cache when possible.
+    """
+    if _alignmentCache is None:
+        return _alignPhonesUncached(phonesA, phonesB, simplifiedMatching)
+
+    key = (tuple(phonesA), tuple(phonesB), simplifiedMatching)
+    result = _alignmentCache.get(key)
+    if result is None:
+        alignedA, alignedB = _alignPhonesUncached(phonesA, phonesB, simplifiedMatching)
+        _alignmentCache[key] = (tuple(alignedA), tuple(alignedB))
+        return alignedA, alignedB
+
+    # Return copies, as callers are free to modify the lists
+    return list(result[0]), list(result[1])
+
+
+def _alignPhonesUncached(
+    phonesA: List[str], phonesB: List[str], simplifiedMatching: bool
+) -> Tuple[List[str], List[str]]:
+    if not simplifiedMatching:
+        return _alignPhones(phonesA, phonesB)
+
+    alignedA, alignedB = _alignPhones(
+        [_simplifyPhone(phone) for phone in phonesA],
+        [_simplifyPhone(phone) for phone in phonesB],
+    )
+    return _undoSimplification(phonesA, alignedA), _undoSimplification(
+        phonesB, alignedB
+    )
+
+
+def _undoSimplification(rawPhones: List[str], alignedPhones: List[str]) -> List[str]:
+    """Replaces simplified phones with the original phones, keeping the fillers"""
+    rawPhoneIter = iter(rawPhones)
+    return [
+        (
+            next(rawPhoneIter)
+            if phone != phonetic_constants.FILLER
+            else phonetic_constants.FILLER
+        )
+        for phone in alignedPhones
+    ]
+
+
+def _alignPhones(phonesA: List[str], phonesB: List[str]) -> Tuple[List[str], List[str]]:
+    """See PhonemeList.align()"""
+    sequenceIndexListA, sequenceIndexListB = _findCommonIndicies(phonesA, phonesB)
+
+    # Copy the phones between the common elements, padding the shorter
+    # run with blanks, such that the common elements line up and the two
+    # lists are the same length
+    alignedA: List[str] = []
+    alignedB: List[str] = []
+    prevA = 0
+    prevB = 0
+    for indexA, indexB in zip(sequenceIndexListA, sequenceIndexListB):
+        alignedA.extend(phonesA[prevA:indexA])
+        alignedB.extend(phonesB[prevB:indexB])
+
+        numBlanks = (indexB - prevB) - (indexA - prevA)
+        if numBlanks > 0:
+            alignedA.extend([phonetic_constants.FILLER] * numBlanks)
+        elif numBlanks < 0:
+            alignedB.extend([phonetic_constants.FILLER] * -numBlanks)
+
+        alignedA.extend(phonesA[indexA : indexA + 1])
+        alignedB.extend(phonesB[indexB : indexB + 1])
+        prevA = indexA + 1
+        prevB = indexB + 1
+
+    return alignedA, alignedB
+
+
+def _countAlignmentDiffs(
+    phonesA: List[str], phonesB: List[str], simplifiedMatching: bool
+) -> int:
+    """Counts the blanks that aligning two lists of phones would insert
+
+    This is the same as counting the fillers in the output of alignPhones(),
+    without building the aligned lists.  If the alignment cache is enabled,
+    the count comes from the cached alignment instead.
+    """
+    if _alignmentCache is not None:
+        alignedA, alignedB = alignPhones(phonesA, phonesB, simplifiedMatching)
+        return alignedA.count(phonetic_constants.FILLER) + alignedB.count(
+            phonetic_constants.FILLER
+        )
+
+    if simplifiedMatching:
+        phonesA = [_simplifyPhone(phone) for phone in phonesA]
+        phonesB = [_simplifyPhone(phone) for phone in phonesB]
+
+    sequenceIndexListA, sequenceIndexListB = _findCommonIndicies(phonesA, phonesB)
+
+    numDiffs = 0
+    prevA = 0
+    prevB = 0
+    for indexA, indexB in zip(sequenceIndexListA, sequenceIndexListB):
+        numDiffs += abs((indexB - prevB) - (indexA - prevA))
+        prevA = indexA + 1
+        prevB = indexB + 1
+
+    return numDiffs
+
+
+def _findCommonIndicies(
+    phonesA: List[str], phonesB: List[str]
+) -> Tuple[List[int], List[int]]:
+    """Finds where the longest common sequence of phones occurs in each list
+
+    The index lists end with the length of each list.
+    """
+    # Find the longest sequence
+    sequence = utils.getLongestCommonSubsequence(phonesB, phonesA)
+
+    # Find the index of the sequence in each list
+    # TODO: investigate ambiguous cases
+    startA = 0
+    startB = 0
+    sequenceIndexListA = []
+    sequenceIndexListB = []
+    for phone in sequence:
+        startA = phonesA.index(phone, startA)
+        startB = phonesB.index(phone, startB)
+
+        sequenceIndexListA.append(startA)
+        sequenceIndexListB.append(startB)
+
+        startA += 1
+        startB += 1
+
+    # An index on the tail of both will be used to create output strings
+    # of the same length
+    sequenceIndexListA.append(len(phonesA))
+    sequenceIndexListB.append(len(phonesB))
+
+    return sequenceIndexListA, sequenceIndexListB
+
+
 def _toPhonemeList(phoneList: Union[PhonemeList, List[str]]) -> PhonemeList:
     """Utility function to unify the input to be PhonemeList"""
     if isinstance(phoneList, list):
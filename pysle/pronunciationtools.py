@@ -6,7 +6,9 @@ otherwise available in different areas of the pysle code
 base.
 """
 
-from typing import List, Tuple, Union
+import functools
+import multiprocessing
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
 from pysle import isletool
 from pysle import phonetics
@@ -103,3 +105,61 @@ def alignPronunciations(
     phonemesB = phonetics._toPhonemeList(phoneListB)
 
     return phonemesA.align(phonemesB, simplifiedMatching)
+
+
+def alignMany(
+    pairs: Iterable[
+        Tuple[
+            Union[List[str], phonetics.PhonemeList],
+            Union[List[str], phonetics.PhonemeList],
+        ]
+    ],
+    simplifiedMatching: bool = True,
+    processes: Optional[int] = None,
+    chunkSize: int = 1000,
+) -> Iterator[Tuple[phonetics.PhonemeList, phonetics.PhonemeList]]:
+    """Align many pairs of phone lists; see alignPronunciations()
+
+    The alignments are done on plain lists of phones; PhonemeLists are
+    only built for each pair as it is yielded.
+
+    Args:
+        pairs: pairs of phone lists to align
+        simplifiedMatching: if True, merge all vowels into the symbol "V" and
+            all rhotics into the symbol "R", for the purpose of comparing the
+            two pronunciations
+        processes: if given, split the alignments across this many worker
+            processes
+        chunkSize: with processes, the number of pairs to send to a worker
+            at a time
+
+    Yields:
+        the aligned pairs of phone lists, in the same order as the input
+    """
+    phonePairs = (
+        (_toPhoneList(phoneListA), _toPhoneList(phoneListB))
+        for phoneListA, phoneListB in pairs
+    )
+    alignPair = functools.partial(_alignPair, simplifiedMatching=simplifiedMatching)
+
+    if processes is None:
+        for alignedA, alignedB in map(alignPair, phonePairs):
+            yield phonetics.PhonemeList(alignedA), phonetics.PhonemeList(alignedB)
+        return
+
+    with multiprocessing.Pool(processes) as pool:
+        for alignedA, alignedB in pool.imap(alignPair, phonePairs, chunkSize):
+            yield phonetics.PhonemeList(alignedA), phonetics.PhonemeList(alignedB)
+
+
+def _toPhoneList(phoneList: Union[List[str], phonetics.PhonemeList]) -> List[str]:
+    if isinstance(phoneList, phonetics.PhonemeList):
+        return phoneList.phonemes
+
+    return phoneList
+
+
+def _alignPair(
+    phonePair: Tuple[List[str], List[str]], simplifiedMatching: bool
+) -> Tuple[List[str], List[str]]:
+    return phonetics.alignPhones(phonePair[0], phonePair[1], simplifiedMatching)
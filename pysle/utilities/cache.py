@@ -0,0 +1,127 @@
+# encoding: utf-8
+
+from collections import OrderedDict
+from typing import (
+    Generic,
+    Iterator,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    TypeVar,
+)
+from typing_extensions import Literal
+
+from pysle.utilities import constants
+from pysle.utilities import utils
+
+KT = TypeVar("KT")
+VT = TypeVar("VT")
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class BoundedCache(MutableMapping[KT, VT], Generic[KT, VT]):
+    """A dict-like cache that holds at most maxsize items
+
+    When full, adding an item evicts the least recently used item ('lru')
+    or the oldest item ('fifo').  Reading an item through [] or get()
+    counts as a hit or a miss; checking membership with 'in' doesn't.
+
+    Args:
+        maxsize: the maximum number of items to hold; if None, the cache
+            is unbounded
+        policy: which item to evict when the cache is full
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = None,
+        policy: Literal["lru", "fifo"] = "lru",
+    ):
+        utils.validateOption("policy", policy, constants.CachePolicy)
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"maxsize must not be negative, got {maxsize}")
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items: "OrderedDict[KT, VT]" = OrderedDict()
+
+    def __getitem__(self, key: KT) -> VT:
+        try:
+            value = self._items[key]
+        except KeyError:
+            self.misses += 1
+            raise
+
+        self.hits += 1
+        if self.policy == constants.CachePolicy.LRU:
+            self._items.move_to_end(key)
+
+        return value
+
+    def __setitem__(self, key: KT, value: VT) -> None:
+        if self.maxsize == 0:
+            return
+
+        self._items[key] = value
+        if self.policy == constants.CachePolicy.LRU:
+            self._items.move_to_end(key)
+
+        if self.maxsize is not None:
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def __delitem__(self, key: KT) -> None:
+        del self._items[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
+
+    def __iter__(self) -> Iterator[KT]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BoundedCache):
+            other = other._items
+        return dict(self._items) == other
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self._items)!r})"
+
+    def peek(self, key: KT, default: Optional[VT] = None) -> Optional[VT]:
+        """Gets an item without counting a hit or a miss or updating its recency"""
+        return self._items.get(key, default)
+
+    def items(self):
+        return self._items.items()
+
+    def values(self):
+        return self._items.values()
+
+    def clear(self) -> None:
+        """Removes all items; the statistics are kept"""
+        self._items.clear()
+
+    def cacheInfo(self) -> CacheInfo:
+        """Get the statistics for this cache
+
+        Returns:
+            a named tuple with the fields hits, misses, evictions,
+            maxsize, and currsize
+        """
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self._items)
+        )
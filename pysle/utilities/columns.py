@@ -0,0 +1,110 @@
+# encoding: utf-8
+"""A columnar, offset-encoded view of a whole dictionary
+
+Every column is a flat array, in the style of Apache Arrow, so that
+aggregate queries (phoneme frequencies, syllable counts, etc) can work
+on arrays instead of walking Entry objects.  The arrays support the
+buffer protocol, so they can be wrapped without copying, e.g. with
+numpy.frombuffer(columns.phonemeCodes, dtype=numpy.uint16).
+"""
+
+import array
+from typing import Iterable, List, NamedTuple, Tuple
+
+from pysle.utilities import isle_io
+from pysle.utilities import symbol_table
+from pysle.utilities import utils
+
+# Flags in IsleColumns.syllableFlags
+PRIMARY_STRESS = 1
+SECONDARY_STRESS = 2
+WORD_START = 4
+
+
+class IsleColumns(NamedTuple):
+    """The entries of a dictionary, as columns
+
+    Entry i belongs to words[entryWordIds[i]] and has the syllables
+    entrySyllableOffsets[i] up to entrySyllableOffsets[i + 1].  Likewise,
+    syllable j has the phonemes syllablePhonemeOffsets[j] up to
+    syllablePhonemeOffsets[j + 1].
+
+    Attributes:
+        words: each distinct word, indexed by word id
+        entryWordIds: the word id of each entry
+        entryPosMasks: the part of speech tags of each entry, as a bitmask
+            (see utils.getPosBitmask())
+        entrySyllableOffsets: where each entry's syllables start; one
+            longer than the number of entries
+        syllableFlags: PRIMARY_STRESS, SECONDARY_STRESS, and WORD_START
+            (the first syllable of each word in a multiword entry)
+        syllablePhonemeOffsets: where each syllable's phonemes start; one
+            longer than the number of syllables
+        phonemeCodes: the phonemes, as codes from symbol_table.phonemeTable
+    """
+
+    words: List[str]
+    entryWordIds: array.array
+    entryPosMasks: array.array
+    entrySyllableOffsets: array.array
+    syllableFlags: array.array
+    syllablePhonemeOffsets: array.array
+    phonemeCodes: array.array
+
+
+def buildColumns(items: Iterable[Tuple[str, List[str]]]) -> IsleColumns:
+    """Build the columns from the raw lines of a dictionary
+
+    Args:
+        items: pairs of words and their raw isle lines, as in Isle.rawData.items()
+
+    Returns:
+        the entries of the dictionary, as columns
+    """
+    words: List[str] = []
+    entryWordIds = array.array("I")
+    entryPosMasks = array.array("Q")
+    entrySyllableOffsets = array.array("I", [0])
+    syllableFlags = array.array("B")
+    syllablePhonemeOffsets = array.array("I", [0])
+    phonemeCodes = array.array("H")
+
+    getCode = symbol_table.phonemeTable.getCode
+    for word, lines in items:
+        wordId = len(words)
+        words.append(word)
+
+        for line in lines:
+            entryInfo = isle_io.parseIslePronunciation(word, line)
+            entryWordIds.append(wordId)
+            entryPosMasks.append(utils.getPosBitmask(entryInfo["posList"]))
+
+            for syllabification in entryInfo["syllabificationList"]:
+                flags = WORD_START
+                # Empty syllables are dropped, as in phonetics.Syllabification
+                for syllable in syllabification:
+                    if len(syllable) == 0:
+                        continue
+
+                    for phone in syllable:
+                        if "ˈ" in phone:
+                            flags |= PRIMARY_STRESS
+                        if "ˌ" in phone:
+                            flags |= SECONDARY_STRESS
+                        phonemeCodes.append(getCode(phone))
+
+                    syllableFlags.append(flags)
+                    syllablePhonemeOffsets.append(len(phonemeCodes))
+                    flags = 0
+
+            entrySyllableOffsets.append(len(syllableFlags))
+
+    return IsleColumns(
+        words,
+        entryWordIds,
+        entryPosMasks,
+        entrySyllableOffsets,
+        syllableFlags,
+        syllablePhonemeOffsets,
+        phonemeCodes,
+    )
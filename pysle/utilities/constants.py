@@ -7,6 +7,15 @@ ISLE_DOWNLOAD_URL = "https://github.com/uiuc-sst/g2ps/tree/master/English/ISLEdi
 
 DEFAULT_ISLE_DICT_PATH = resource_filename("pysle", "data/ISLEdict.txt")
 
+# Files derived from a dictionary are saved in the user's cache directory,
+# with these extensions
+COMPILED_ISLE_DICT_EXT = ".compiled"
+PACKED_ISLE_DICT_EXT = ".packed"
+SEARCH_INDEX_EXT = ".search"
+
+# Overrides where files derived from dictionaries are saved
+CACHE_DIR_ENV_VAR = "PYSLE_CACHE_DIR"
+
 
 class LengthOptions:
     SHORTEST: Final = "shortest"
@@ -29,3 +38,17 @@ class AcceptabilityMode:
     NO: Final = "no"
 
     validOptions = [OK, ONLY, NO]
+
+
+class IsleBackend:
+    DICT: Final = "dict"
+    MMAP: Final = "mmap"
+
+    validOptions = [DICT, MMAP]
+
+
+class CachePolicy:
+    LRU: Final = "lru"
+    FIFO: Final = "fifo"
+
+    validOptions = [LRU, FIFO]
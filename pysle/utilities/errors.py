@@ -29,7 +29,7 @@ class FindClosestError(PysleException):
 
 class WordNotInIsleError(PysleException):
     def __init__(self, word: str):
-        super(WordNotInIsleError, self).__init__()
+        super(WordNotInIsleError, self).__init__(word)
         self.word = word
 
     def __str__(self):
@@ -49,6 +49,14 @@ class IsleDictDoesNotExistError(PysleException):
         )
 
 
+class SharedMemoryNotSupportedError(PysleException):
+    def __str__(self):
+        return (
+            "Sharing a dictionary between processes requires "
+            "multiprocessing.shared_memory, which was added in Python 3.8"
+        )
+
+
 class WrongOptionError(PysleException):
     def __init__(self, argumentName: str, givenValue: str, availableOptions: List[str]):
         self.argumentName = argumentName
@@ -1,9 +1,33 @@
 # encoding: utf-8
 
+import array
+import contextlib
+import gc
+import hashlib
 import io
-from typing import List, Dict, Any
+import json
+import mmap
+import os
+import pickle
+import struct
+import sys
+import weakref
+from collections.abc import ItemsView, Mapping
+from typing import List, Dict, Any, Iterator, Optional, Set
 
 from pysle import phonetics
+from pysle.utilities import constants
+from pysle.utilities import errors
+from pysle.utilities import symbol_table
+
+# Bump these whenever the layout of compiled files changes
+COMPILED_DICT_FORMAT = "isle_dict/1"
+PACKED_FORMAT_VERSION = 2
+PACKED_MAGIC = b"PYSLEPK\0"
+
+# Directories that compiled files could not be written to; they aren't
+# retried for the rest of the process
+_unwritableDirs: Set[str] = set()
 
 
 def _parsePronunciation(
@@ -51,7 +75,12 @@ def parseIslePronunciation(word, line: str) -> Dict[str, Any]:
     while wordEnd != -1:
         phonesAsStr = line[wordStart:wordEnd]
         syllables = phonesAsStr.split(".")
-        pronunciationInfo.append([syllable.split() for syllable in syllables])
+        pronunciationInfo.append(
+            [
+                symbol_table.phonemeTable.intern(syllable.split())
+                for syllable in syllables
+            ]
+        )
         wordStart = wordEnd + 1
         wordEnd = line.find("#", wordStart + 1)
 
@@ -65,6 +94,19 @@ def getWordFromLine(line: str) -> str:
     return word
 
 
+def getPosListFromLine(line: str) -> List[str]:
+    """Gets the part of speech tags of a raw isle line, as in Entry.posList"""
+    i = line.find("(") + 1
+    j = line.find(")", i)
+
+    return [pos for pos in line[i:j].split(",") if len(pos) <= 3]
+
+
+def getWordCountFromLine(line: str) -> int:
+    """Gets the number of words in the pronunciation of a raw isle line"""
+    return max(line.count("#", line.find(")")) - 1, 0)
+
+
 def readIsleDict(islePath: str) -> Dict[str, List[str]]:
     """
     Reads into memory and builds the isle textfile into a dictionary for fast searching
@@ -77,3 +119,601 @@ def readIsleDict(islePath: str) -> Dict[str, List[str]]:
             lexDict[word].append(line)
 
     return lexDict
+
+
+def getFileSignature(islePath: str) -> Dict[str, Any]:
+    """Returns the size, modification time, and hash of a file
+
+    Used to determine if a compiled dictionary is still in sync with
+    the dictionary it was built from.
+    """
+    stat = os.stat(islePath)
+    return {
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "hash": _hashFile(islePath),
+    }
+
+
+def _hashFile(path: str) -> str:
+    hasher = hashlib.sha1()
+    with io.open(path, "rb") as fd:
+        for block in iter(lambda: fd.read(1 << 20), b""):
+            hasher.update(block)
+
+    return hasher.hexdigest()
+
+
+def _isSignatureCurrent(signature: Dict[str, Any], islePath: str) -> bool:
+    """Is the signature of a compiled file still valid for the source dictionary?
+
+    The size and modification time are checked first; the file is only hashed
+    when the modification time changed but the size did not (e.g. the file
+    was copied or touched).
+    """
+    stat = os.stat(islePath)
+    if signature.get("size") != stat.st_size:
+        return False
+
+    if signature.get("mtime") == stat.st_mtime_ns:
+        return True
+
+    return signature.get("hash") == _hashFile(islePath)
+
+
+@contextlib.contextmanager
+def _pausedGarbageCollection() -> Iterator[None]:
+    """Unpickling allocates many small containers, which repeatedly triggers the gc"""
+    wasEnabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if wasEnabled:
+            gc.enable()
+
+
+def getUserCacheDir() -> str:
+    """Where files derived from isle dictionaries are saved
+
+    This is $PYSLE_CACHE_DIR if set, otherwise a 'pysle' folder in the
+    user's cache directory ($XDG_CACHE_HOME, %LOCALAPPDATA% on Windows,
+    or ~/.cache).
+
+    Compiled files are unpickled when they are loaded, so this directory
+    must only be writable by the user; don't point $PYSLE_CACHE_DIR at a
+    shared directory.
+    """
+    cacheDir = os.environ.get(constants.CACHE_DIR_ENV_VAR)
+    if cacheDir:
+        return cacheDir
+
+    cacheRoot = os.environ.get("XDG_CACHE_HOME")
+    if not cacheRoot and os.name == "nt":
+        cacheRoot = os.environ.get("LOCALAPPDATA")
+    if not cacheRoot:
+        cacheRoot = os.path.join(os.path.expanduser("~"), ".cache")
+
+    return os.path.join(cacheRoot, "pysle")
+
+
+def getCachePath(islePath: str, extension: str) -> str:
+    """Where a file derived from an isle dictionary is saved
+
+    Derived files go in the user's cache directory (see getUserCacheDir()),
+    never next to the dictionary, so nothing is written inside the installed
+    package and no one else can plant a file that will be unpickled.
+    """
+    absPath = os.path.abspath(islePath)
+
+    # Dictionaries with the same name in different places each get their own files
+    pathHash = hashlib.sha1(absPath.encode("utf-8")).hexdigest()[:8]
+    fileName = f"{os.path.basename(islePath)}-{pathHash}{extension}"
+
+    return os.path.join(getUserCacheDir(), fileName)
+
+
+def getCompiledPath(islePath: str) -> str:
+    return getCachePath(islePath, constants.COMPILED_ISLE_DICT_EXT)
+
+
+def compileIsleDict(
+    islePath: str, compiledPath: Optional[str] = None
+) -> Dict[str, List[str]]:
+    """
+    Reads an isle textfile and saves it in a binary format that is faster to load
+
+    Args:
+        islePath: the path to the isle dictionary
+        compiledPath: where to save the compiled dictionary; if None, the path
+            from getCompiledPath() is used
+
+    Returns:
+        the isle dictionary, as read by readIsleDict()
+    """
+    if compiledPath is None:
+        compiledPath = getCompiledPath(islePath)
+
+    lexDict = readIsleDict(islePath)
+    saveCompiledObject(lexDict, islePath, compiledPath, COMPILED_DICT_FORMAT)
+
+    return lexDict
+
+
+def loadCompiledIsleDict(
+    islePath: str, compiledPath: Optional[str] = None
+) -> Dict[str, List[str]]:
+    """
+    Loads a compiled isle dictionary; compiles it first if it is missing or stale
+
+    If the compiled dictionary cannot be written (e.g. the cache directory is
+    read-only), the isle textfile is read directly instead, and writing
+    there isn't attempted again for the rest of the process.
+
+    Args:
+        islePath: the path to the isle dictionary
+        compiledPath: the path to the compiled dictionary; if None, the path
+            from getCompiledPath() is used
+
+    Returns:
+        the same dictionary that readIsleDict() would return
+    """
+    if compiledPath is None:
+        compiledPath = getCompiledPath(islePath)
+
+    lexDict = loadCompiledObject(islePath, compiledPath, COMPILED_DICT_FORMAT)
+    if lexDict is not None:
+        return lexDict
+
+    lexDict = readIsleDict(islePath)
+    try:
+        saveCompiledObject(lexDict, islePath, compiledPath, COMPILED_DICT_FORMAT)
+    except OSError:
+        pass
+
+    return lexDict
+
+
+def _checkWritable(path: str) -> None:
+    """Raises OSError if path can't be written to, before any work is done on it"""
+    directory = os.path.dirname(os.path.abspath(path))
+    if directory in _unwritableDirs:
+        raise PermissionError(f"Can't write to '{directory}'")
+
+    try:
+        # A new cache directory is private to the user
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+    except OSError:
+        _unwritableDirs.add(directory)
+        raise
+
+    if not os.access(directory, os.W_OK):
+        _unwritableDirs.add(directory)
+        raise PermissionError(f"Can't write to '{directory}'")
+
+
+def saveCompiledObject(
+    obj: Any, islePath: str, compiledPath: str, formatId: str
+) -> None:
+    """
+    Pickles data derived from an isle dictionary, tagged with the dictionary's signature
+
+    Args:
+        obj: the data to save
+        islePath: the path to the isle dictionary that obj was derived from
+        compiledPath: where to save obj
+        formatId: identifies the type and version of obj
+
+    Raises:
+        OSError: compiledPath could not be written to
+    """
+    _checkWritable(compiledPath)
+    header = {"format": formatId, **getFileSignature(islePath)}
+
+    content = pickle.dumps(header, protocol=pickle.HIGHEST_PROTOCOL)
+    content += pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    _atomicWrite(compiledPath, content)
+
+
+def loadCompiledObject(islePath: str, compiledPath: str, formatId: str) -> Any:
+    """
+    Loads data saved with saveCompiledObject()
+
+    Args:
+        islePath: the path to the isle dictionary that the data was derived from
+        compiledPath: where the data was saved
+        formatId: identifies the type and version of the data
+
+    Returns:
+        the saved data or None if it is missing, stale, in a different format,
+        or can't be read (e.g. the file is truncated or refers to a class that
+        has since moved), so that the caller rebuilds it
+    """
+    try:
+        with io.open(compiledPath, "rb") as fd:
+            header = pickle.load(fd)
+            if (
+                isinstance(header, dict)
+                and header.get("format") == formatId
+                and _isSignatureCurrent(header, islePath)
+            ):
+                with _pausedGarbageCollection():
+                    return pickle.load(fd)
+    except Exception:
+        pass
+
+    return None
+
+
+class PackedIsleDict(Mapping):
+    """A read-only, zero-copy view of an isle dictionary stored in a flat buffer
+
+    The buffer is typically a memory-mapped file or a block of shared memory, so
+    that several processes can share a single copy of the dictionary.  Lines are
+    only decoded when a word is accessed.
+
+    Buffer layout (see packIsleDict()):
+        - magic bytes
+        - the length of the header (4 bytes), followed by the header in json
+        - padding, to align the body to 8 bytes
+        - the body, made of sections; the header holds the position of each
+          section, relative to the start of the body
+            - keys: the words in utf-8; words are sorted by their encoding,
+              which allows binary search
+            - keyOffsets: numWords + 1 offsets into keys
+            - order: the index of each word in keys, in the order the words
+              appeared in the dictionary; words are iterated in this order,
+              as they are for a dict
+            - wordLines: numWords + 1 indicies into lineOffsets
+            - lines: the lines of the dictionary in utf-8, grouped by word
+            - lineOffsets: numLines + 1 offsets into lines
+    """
+
+    def __init__(self, buffer, path: Optional[str] = None, sharedMemory=None):
+        view = memoryview(buffer)
+        if bytes(view[: len(PACKED_MAGIC)]) != PACKED_MAGIC:
+            raise ValueError("Buffer does not contain a packed isle dictionary")
+
+        headerStart = len(PACKED_MAGIC) + 4
+        (headerLen,) = struct.unpack_from("<I", view, len(PACKED_MAGIC))
+        self.header = json.loads(bytes(view[headerStart : headerStart + headerLen]))
+        bodyStart = _alignTo(headerStart + headerLen, 8)
+
+        def getSection(name: str) -> memoryview:
+            start, length, typecode = self.header["sections"][name]
+            section = view[bodyStart + start : bodyStart + start + length]
+            return section.cast(typecode) if typecode != "B" else section
+
+        self._buffer = buffer
+        self._path = path
+        self._sharedMemory = sharedMemory
+        self._numWords = self.header["numWords"]
+        self._keys = getSection("keys")
+        self._keyOffsets = getSection("keyOffsets")
+        self._order = getSection("order")
+        self._wordLines = getSection("wordLines")
+        self._lines = getSection("lines")
+        self._lineOffsets = getSection("lineOffsets")
+        view.release()
+
+        # The sections must be released before the buffer is closed, or closing
+        # it fails with a BufferError; this also runs if close() is never called
+        self._finalizer = weakref.finalize(
+            self,
+            _releaseBuffer,
+            [
+                self._keys,
+                self._keyOffsets,
+                self._order,
+                self._wordLines,
+                self._lines,
+                self._lineOffsets,
+            ],
+            buffer,
+            sharedMemory,
+        )
+
+    def __reduce__(self):
+        # Reopen the same file or shared memory, rather than copying the data
+        if self._path is not None:
+            return (_openPackedIsleDict, (self._path,))
+        if self._sharedMemory is not None:
+            return (attachSharedIsleDict, (self._sharedMemory.name,))
+        raise TypeError("Only file-backed or shared PackedIsleDicts can be pickled")
+
+    def __len__(self) -> int:
+        return self._numWords
+
+    def __iter__(self) -> Iterator[str]:
+        for i in self._order:
+            yield self._getKey(i).decode("utf-8")
+
+    def __contains__(self, word) -> bool:
+        return isinstance(word, str) and self._find(word) is not None
+
+    def __getitem__(self, word: str) -> List[str]:
+        i = self._find(word) if isinstance(word, str) else None
+        if i is None:
+            raise KeyError(word)
+
+        return self._getLines(i)
+
+    def items(self):
+        return _PackedItemsView(self)
+
+    def close(self) -> None:
+        """Releases the buffer; the dictionary can't be used afterwards"""
+        self._finalizer()
+
+    def _getKey(self, i: int) -> bytes:
+        return bytes(self._keys[self._keyOffsets[i] : self._keyOffsets[i + 1]])
+
+    def _getLines(self, i: int) -> List[str]:
+        lineOffsets = self._lineOffsets
+        return [
+            str(self._lines[lineOffsets[j] : lineOffsets[j + 1]], "utf-8")
+            for j in range(self._wordLines[i], self._wordLines[i + 1])
+        ]
+
+    def _find(self, word: str) -> Optional[int]:
+        """Binary search for the index of a word"""
+        try:
+            key = word.encode("utf-8")
+        except UnicodeEncodeError:
+            return None
+
+        low = 0
+        high = self._numWords
+        while low < high:
+            mid = (low + high) // 2
+            if self._getKey(mid) < key:
+                low = mid + 1
+            else:
+                high = mid
+
+        if low < self._numWords and self._getKey(low) == key:
+            return low
+
+        return None
+
+
+def _releaseBuffer(sections: List[memoryview], buffer, sharedMemory) -> None:
+    for section in sections:
+        section.release()
+
+    if sharedMemory is not None:
+        sharedMemory.close()
+    elif hasattr(buffer, "close"):
+        buffer.close()
+
+
+class _PackedItemsView(ItemsView):
+    def __iter__(self):
+        packedDict = self._mapping
+        for i in packedDict._order:
+            yield packedDict._getKey(i).decode("utf-8"), packedDict._getLines(i)
+
+
+def packIsleDict(
+    lexDict: Mapping[str, List[str]], signature: Optional[Dict[str, Any]] = None
+) -> bytes:
+    """
+    Serializes an isle dictionary into the format read by PackedIsleDict
+
+    Args:
+        lexDict: an isle dictionary, as returned by readIsleDict()
+        signature: information identifying the source of the dictionary
+            (see getFileSignature()); stored in the header
+
+    Returns:
+        the packed dictionary
+    """
+    # Words are stored sorted, for binary search, and iterated in their
+    # original order
+    encodedItems = sorted(
+        (word.encode("utf-8"), i, [line.encode("utf-8") for line in lines])
+        for i, (word, lines) in enumerate(lexDict.items())
+    )
+    order = array.array("Q", [0] * len(encodedItems))
+
+    keys = bytearray()
+    keyOffsets = array.array("Q", [0])
+    wordLines = array.array("Q", [0])
+    lines = bytearray()
+    lineOffsets = array.array("Q", [0])
+    for sortedIndex, (key, originalIndex, encodedLines) in enumerate(encodedItems):
+        order[originalIndex] = sortedIndex
+        keys += key
+        keyOffsets.append(len(keys))
+        for line in encodedLines:
+            lines += line
+            lineOffsets.append(len(lines))
+        wordLines.append(len(lineOffsets) - 1)
+
+    sections: Dict[str, List[Any]] = {}
+    body = bytearray()
+    for name, content, typecode in [
+        ("keyOffsets", keyOffsets.tobytes(), keyOffsets.typecode),
+        ("order", order.tobytes(), order.typecode),
+        ("wordLines", wordLines.tobytes(), wordLines.typecode),
+        ("lineOffsets", lineOffsets.tobytes(), lineOffsets.typecode),
+        ("keys", keys, "B"),
+        ("lines", lines, "B"),
+    ]:
+        body += b"\0" * (_alignTo(len(body), 8) - len(body))
+        sections[name] = [len(body), len(content), typecode]
+        body += content
+
+    header = {
+        "version": PACKED_FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "numWords": len(encodedItems),
+        "sections": sections,
+        **(signature or {}),
+    }
+    headerBytes = json.dumps(header).encode("utf-8")
+
+    packed = bytearray(PACKED_MAGIC)
+    packed += struct.pack("<I", len(headerBytes))
+    packed += headerBytes
+    packed += b"\0" * (_alignTo(len(packed), 8) - len(packed))
+    packed += body
+
+    return bytes(packed)
+
+
+def _alignTo(value: int, alignment: int) -> int:
+    return (value + alignment - 1) // alignment * alignment
+
+
+def getPackedPath(islePath: str) -> str:
+    return getCachePath(islePath, constants.PACKED_ISLE_DICT_EXT)
+
+
+def compilePackedIsleDict(islePath: str, packedPath: Optional[str] = None) -> None:
+    """
+    Reads an isle textfile and saves it in the format read by PackedIsleDict
+
+    Args:
+        islePath: the path to the isle dictionary
+        packedPath: where to save the packed dictionary; if None, the path
+            from getPackedPath() is used
+    """
+    if packedPath is None:
+        packedPath = getPackedPath(islePath)
+
+    packed = packIsleDict(readIsleDict(islePath), getFileSignature(islePath))
+    _atomicWrite(packedPath, packed)
+
+
+def _atomicWrite(path: str, content: bytes) -> None:
+    """Writes to a temporary file first so other processes never see a partial file"""
+    tmpPath = f"{path}.{os.getpid()}.tmp"
+    try:
+        with io.open(tmpPath, "wb") as fd:
+            fd.write(content)
+        os.replace(tmpPath, path)
+    except OSError:
+        _unwritableDirs.add(os.path.dirname(os.path.abspath(path)))
+        raise
+    finally:
+        if os.path.exists(tmpPath):
+            os.remove(tmpPath)
+
+
+def _isPackedFileCurrent(packedPath: str, islePath: str) -> bool:
+    try:
+        with io.open(packedPath, "rb") as fd:
+            if fd.read(len(PACKED_MAGIC)) != PACKED_MAGIC:
+                return False
+            (headerLen,) = struct.unpack("<I", fd.read(4))
+            header = json.loads(fd.read(headerLen))
+    except (OSError, ValueError, struct.error):
+        return False
+
+    return (
+        header.get("version") == PACKED_FORMAT_VERSION
+        and header.get("byteorder") == sys.byteorder
+        and _isSignatureCurrent(header, islePath)
+    )
+
+
+def _openPackedIsleDict(packedPath: str) -> PackedIsleDict:
+    with io.open(packedPath, "rb") as fd:
+        buffer = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return PackedIsleDict(buffer, packedPath)
+
+
+def loadPackedIsleDict(
+    islePath: str, packedPath: Optional[str] = None
+) -> PackedIsleDict:
+    """
+    Memory-maps a packed isle dictionary; packs it first if it is missing or stale
+
+    Processes that map the same file share its pages through the OS page cache.
+    If the packed dictionary cannot be written (e.g. the cache directory is
+    read-only), it is packed into private memory instead.
+
+    Args:
+        islePath: the path to the isle dictionary
+        packedPath: the path to the packed dictionary; if None, the path
+            from getPackedPath() is used
+
+    Returns:
+        a read-only mapping with the same content that readIsleDict() would return
+    """
+    if packedPath is None:
+        packedPath = getPackedPath(islePath)
+
+    if not _isPackedFileCurrent(packedPath, islePath):
+        try:
+            _checkWritable(packedPath)
+        except OSError:
+            return PackedIsleDict(packIsleDict(readIsleDict(islePath)))
+
+        packed = packIsleDict(readIsleDict(islePath), getFileSignature(islePath))
+        try:
+            _atomicWrite(packedPath, packed)
+        except OSError:
+            return PackedIsleDict(packed)
+
+    return _openPackedIsleDict(packedPath)
+
+
+def sharePackedIsleDict(lexDict: Mapping[str, List[str]]):
+    """
+    Packs an isle dictionary into a new block of shared memory
+
+    The caller owns the block and should call close() and unlink() on it when
+    it is no longer needed.
+
+    Args:
+        lexDict: an isle dictionary, as returned by readIsleDict()
+
+    Returns:
+        a multiprocessing.shared_memory.SharedMemory; other processes can
+        open it with attachSharedIsleDict(sharedMemory.name)
+
+    Raises:
+        SharedMemoryNotSupportedError: on Python 3.7 and older
+    """
+    shared_memory = _importSharedMemory()
+
+    packed = packIsleDict(lexDict)
+    sharedMemory = shared_memory.SharedMemory(create=True, size=len(packed))
+    sharedMemory.buf[: len(packed)] = packed
+
+    return sharedMemory
+
+
+def attachSharedIsleDict(name: str) -> PackedIsleDict:
+    """
+    Opens an isle dictionary that was shared with sharePackedIsleDict()
+
+    No data is copied; the returned mapping reads directly from shared memory.
+
+    Args:
+        name: the name of the shared memory block
+
+    Returns:
+        a read-only mapping with the content of the shared dictionary
+
+    Raises:
+        SharedMemoryNotSupportedError: on Python 3.7 and older
+    """
+    shared_memory = _importSharedMemory()
+
+    sharedMemory = shared_memory.SharedMemory(name=name)
+
+    return PackedIsleDict(sharedMemory.buf, sharedMemory=sharedMemory)
+
+
+def _importSharedMemory():
+    # multiprocessing.shared_memory was added in Python 3.8
+    try:
+        from multiprocessing import shared_memory
+    except ImportError:
+        raise errors.SharedMemoryNotSupportedError()
+
+    return shared_memory
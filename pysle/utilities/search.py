@@ -1,17 +1,215 @@
 # encoding: utf-8
 
+import array
+import functools
+import itertools
+import math
+import multiprocessing
+import multiprocessing.pool
+import os
 import re
 import random
-from typing import Generator, List, Optional, Dict
+from typing import Generator, Iterable, List, Optional, Dict, Tuple, Union
 from typing_extensions import Literal
 
 from pysle.utilities import constants
 from pysle.utilities import utils
 from pysle.utilities import phonetic_constants
 
+# Bump this whenever the layout of SearchIndex changes
+SEARCH_INDEX_FORMAT = "search_index/3"
+
+# The length of the character sequences in the n-gram index
+NGRAM_LEN = 3
+
+# The number of prepared search patterns to keep compiled
+SEARCH_PATTERN_CACHE_SIZE = 256
+
+# For parallel searches, the number of shards to give each worker process.
+# More shards balance the load better but cost more to send.
+SHARDS_PER_WORKER = 4
+
+
+class SearchIndex:
+    """Search data for a dictionary, prepared once and reused across searches
+
+    Attributes:
+        wordInfoList: the word, posList, and pronunciation of each entry,
+            as yielded by search()
+        pronunciations: the pronunciation of each entry without spaces or diacritics
+        stressedPronunciations: the pronunciation of each entry without spaces
+            or diacritics, except for primary stress
+        syllableCounts: the number of syllables in each entry, as counted
+            by search()
+        wordCounts: the number of words in each entry
+        posMasks: the part of speech tags of each entry, as a bitmask
+            (see utils.getPosBitmask())
+
+    An inverted index from n-grams to entries is built the first time that
+    getCandidates() is called, or by buildNgramIndex().  It is used to skip
+    entries that can't possibly match a search pattern.  It is pickled along
+    with the rest of the index if it has been built.
+    """
+
+    def __init__(self, wordInfoList: List[Dict[str, str]]):
+        self.wordInfoList = wordInfoList
+        self.pronunciations: List[str] = []
+        self.stressedPronunciations: List[str] = []
+        self.syllableCounts = array.array("H")
+        self.wordCounts = array.array("H")
+        self.posMasks = array.array("Q")
+        self._segments: Optional[List[str]] = None
+        self._ngramIndex: Optional[Dict[str, array.array]] = None
+
+        for wordInfo in wordInfoList:
+            pronunciation = wordInfo["pronunciation"].replace(" ", "")
+            pronunciation = _stripDiacritics(pronunciation, keep=["ˈ"])
+            self.stressedPronunciations.append(pronunciation)
+            self.pronunciations.append(pronunciation.replace("ˈ", ""))
+
+            self.syllableCounts.append(pronunciation.count(".") + 1)
+            self.wordCounts.append(max(pronunciation.count("#") - 1, 0))
+            self.posMasks.append(utils.getPosBitmask(wordInfo["posList"].split(",")))
+
+    def __len__(self):
+        return len(self.wordInfoList)
+
+    def getPronunciations(self, keptDiacritics: List[str]) -> List[str]:
+        """Get the pronunciations to search over
+
+        Args:
+            keptDiacritics: diacritics that should not be stripped from
+                the pronunciations
+
+        Returns:
+            the pronunciation of each entry without spaces and without any
+            diacritics other than those in keptDiacritics
+        """
+        if len(keptDiacritics) == 0:
+            return self.pronunciations
+        if keptDiacritics == ["ˈ"]:
+            return self.stressedPronunciations
+
+        return [
+            _stripDiacritics(wordInfo["pronunciation"].replace(" ", ""), keptDiacritics)
+            for wordInfo in self.wordInfoList
+        ]
+
+    def getCandidates(self, fragments: List[str]) -> List[int]:
+        """Get the entries that contain all of the given fragments
+
+        Syllable boundaries and diacritics are ignored, so the same
+        fragments should be found by _extractLiteralFragments().
+
+        Args:
+            fragments: sequences of phones and word boundaries
+
+        Returns:
+            the indicies of the candidate entries, in ascending order;
+            all entries if none of the fragments are long enough to
+            look up in the n-gram index
+        """
+        ngrams = {
+            fragment[i : i + NGRAM_LEN]
+            for fragment in fragments
+            for i in range(len(fragment) - NGRAM_LEN + 1)
+        }
+        if len(ngrams) == 0:
+            return list(range(len(self)))
+
+        self.buildNgramIndex()
+        assert self._segments is not None and self._ngramIndex is not None
+
+        emptyPostings = array.array("I")
+        postings = min(
+            (self._ngramIndex.get(ngram, emptyPostings) for ngram in ngrams), key=len
+        )
+        segments = self._segments
+
+        return [
+            i
+            for i in postings
+            if all(fragment in segments[i] for fragment in fragments)
+        ]
+
+    def filterEntries(
+        self,
+        indexList: List[int],
+        numSyllables: Optional[int],
+        multiword: Literal["ok", "only", "no"],
+        pos: Optional[str],
+    ) -> List[int]:
+        """Removes entries that don't satisfy the non-pronunciation search criteria
+
+        Entries are filtered on their syllable count, word count, and part of
+        speech, using the precomputed columns.  The part of speech filter is
+        approximate: entries with tags that aren't in the Penn tagset always
+        pass and must still be checked against their posList.
+
+        Args:
+            indexList: the indicies of the entries to filter, in any order
+            numSyllables, multiword, pos: see search()
+
+        Returns:
+            the indicies of the remaining entries, in the same order
+        """
+        predicates = []
+        if numSyllables is not None:
+            predicates.append((self.syllableCounts, numSyllables.__eq__))
+        if multiword == constants.AcceptabilityMode.ONLY:
+            predicates.append((self.wordCounts, (1).__ne__))
+        elif multiword == constants.AcceptabilityMode.NO:
+            predicates.append((self.wordCounts, (1).__ge__))
+        if pos is not None:
+            queryMask = utils.getPosQueryBitmask(pos)
+            if queryMask is not None:
+                predicates.append((self.posMasks, queryMask.__and__))
+
+        isFullRange = len(indexList) == len(self)
+        for column, predicate in predicates:
+            if isFullRange:
+                # All entries are still in their original order, so the
+                # whole column can be compared in one pass
+                indexList = list(itertools.compress(indexList, map(predicate, column)))
+                isFullRange = False
+            else:
+                indexList = [i for i in indexList if predicate(column[i])]
+
+        return indexList
+
+    def buildNgramIndex(self) -> None:
+        """Builds the n-gram index used by getCandidates(), if not built yet"""
+        if self._ngramIndex is not None:
+            return
+
+        self._segments = [
+            pronunciation.replace(".", "") for pronunciation in self.pronunciations
+        ]
+
+        ngramIndex: Dict[str, List[int]] = {}
+        for i, segments in enumerate(self._segments):
+            ngrams = {
+                segments[j : j + NGRAM_LEN]
+                for j in range(len(segments) - NGRAM_LEN + 1)
+            }
+            for ngram in ngrams:
+                ngramIndex.setdefault(ngram, []).append(i)
+
+        self._ngramIndex = {
+            ngram: array.array("I", postings) for ngram, postings in ngramIndex.items()
+        }
+
+
+def _stripDiacritics(pronunciation: str, keep: List[str]) -> str:
+    for diacritic in phonetic_constants.diacriticList:
+        if diacritic not in keep:
+            pronunciation = pronunciation.replace(diacritic, "")
+
+    return pronunciation
+
 
 def search(
-    searchList: List[Dict[str, str]],
+    searchList: Union[List[Dict[str, str]], SearchIndex],
     matchStr: str,
     numSyllables: Optional[int] = None,
     wordInitial: Literal["ok", "only", "no"] = "ok",
@@ -22,13 +220,22 @@ def search(
     pos: Optional[str] = None,
     exactMatch: bool = False,
     randomize: bool = False,
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    pool: Optional[multiprocessing.pool.Pool] = None,
 ) -> Generator[Dict[str, str], None, None]:
     """Search the isle dictionary based on pronunciation
 
     It's not intended to run this method directly, although you can.
 
     Please see isletool.py Isle.search() for more information.
+
+    searchList can be a list of word info dicts or, to avoid preparing the
+    same data on every search, a SearchIndex built from such a list.  Each
+    result is a copy, so changing it doesn't affect searchList.
     """
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
     utils.validateOption("wordInitial", wordInitial, constants.AcceptabilityMode)
     utils.validateOption("wordFinal", wordFinal, constants.AcceptabilityMode)
     utils.validateOption("spanSyllable", spanSyllable, constants.AcceptabilityMode)
@@ -39,48 +246,107 @@ def search(
 
     # Run search for words
 
-    matchStr = _prepRESearchStr(
+    compiledRE = compileSearchRE(
         matchStr, wordInitial, wordFinal, spanSyllable, stressedSyllable, exactMatch
     )
+    matchStr = compiledRE.pattern
+
+    # A one-off index isn't worth the time it takes to build the n-gram index
+    useNgramIndex = isinstance(searchList, SearchIndex)
+    if not isinstance(searchList, SearchIndex):
+        searchList = SearchIndex(searchList)
+
+    # TODO: Diacritics are fairly complicated.
+    #       For now, don't consider them in searches except
+    #       for when users specifically want to search for
+    #       those diacritics.
+    keptDiacritics = []
+    for diacritic in phonetic_constants.diacriticList:
+        if diacritic == "ˈ":
+            if stressedSyllable == "only" or stressedSyllable == "no":
+                keptDiacritics.append(diacritic)
+                continue
+        if diacritic in matchStr:
+            keptDiacritics.append(diacritic)
+    pronunciations = searchList.getPronunciations(keptDiacritics)
+    wordInfoList = searchList.wordInfoList
 
-    indexList = list(range(len(searchList)))
+    if useNgramIndex:
+        indexList = searchList.getCandidates(_extractLiteralFragments(matchStr))
+    else:
+        indexList = list(range(len(searchList)))
+    indexList = searchList.filterEntries(indexList, numSyllables, multiword, pos)
+    if pos is not None:
+        indexList = [i for i in indexList if pos in wordInfoList[i]["posList"]]
     if randomize:
         random.shuffle(indexList)
 
-    compiledRE = re.compile(matchStr)
-    for i in indexList:
-        wordInfo = searchList[i]
-
-        # Search for pos
-        if pos is not None:
-            if pos not in wordInfo["posList"]:
-                continue
-
-        searchPron = wordInfo["pronunciation"].replace(" ", "")
-
-        # TODO: Diacritics are fairly complicated.
-        #       For now, don't consider them in searches except
-        #       for when users specifically want to search for
-        #       those diacritics.
-        for diacritic in phonetic_constants.diacriticList:
-            if diacritic == "ˈ":
-                if stressedSyllable == "only" or stressedSyllable == "no":
-                    continue
-            if diacritic in matchStr:
-                continue
-            searchPron = searchPron.replace(diacritic, "")
+    if pool is None and (workers is None or workers == 1):
+        for i in _matchEntries(
+            pronunciations, indexList, compiledRE, spanSyllable, stressedSyllable
+        ):
+            yield dict(wordInfoList[i])
+        return
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # Workers only get the pronunciations they need and only send back
+    # the positions of the matches, to keep the cost of pickling down
+    chunkSize = max(math.ceil(len(indexList) / (workers * SHARDS_PER_WORKER)), 1)
+    shards = (
+        (
+            start,
+            [pronunciations[i] for i in indexList[start : start + chunkSize]],
+            matchStr,
+            spanSyllable,
+            stressedSyllable,
+        )
+        for start in range(0, len(indexList), chunkSize)
+    )
+    if pool is None:
+        with multiprocessing.Pool(workers) as newPool:
+            results = _mapShards(newPool, shards, ordered)
+            for start, matchList in results:
+                for j in matchList:
+                    yield dict(wordInfoList[indexList[start + j]])
+        return
+
+    for start, matchList in _mapShards(pool, shards, ordered):
+        for j in matchList:
+            yield dict(wordInfoList[indexList[start + j]])
+
+
+def _mapShards(
+    pool: multiprocessing.pool.Pool, shards: Iterable[tuple], ordered: bool
+) -> Iterable[Tuple[int, List[int]]]:
+    if ordered:
+        return pool.imap(_matchShard, shards)
+
+    return pool.imap_unordered(_matchShard, shards)
+
+
+def _matchShard(shard) -> Tuple[int, List[int]]:
+    start, pronunciations, matchStr, spanSyllable, stressedSyllable = shard
+    matchList = _matchEntries(
+        pronunciations,
+        range(len(pronunciations)),
+        re.compile(matchStr),
+        spanSyllable,
+        stressedSyllable,
+    )
+    return start, list(matchList)
 
-        if numSyllables is not None:
-            if numSyllables != searchPron.count(".") + 1:
-                continue
 
-        # Is this a compound word?
-        if multiword == "only":
-            if searchPron.count("#") == 2:
-                continue
-        elif multiword == "no":
-            if searchPron.count("#") > 2:
-                continue
+def _matchEntries(
+    pronunciations: List[str],
+    indexList: Iterable[int],
+    compiledRE: "re.Pattern[str]",
+    spanSyllable: Literal["ok", "only", "no"],
+    stressedSyllable: Literal["ok", "only", "no"],
+) -> Generator[int, None, None]:
+    for i in indexList:
+        searchPron = pronunciations[i]
 
         matchList = compiledRE.findall(searchPron)
         if len(matchList) == 0:
@@ -102,12 +368,157 @@ def search(
             if all(["." in txt[1:-1] for txt in matchList]):
                 continue
 
-        yield wordInfo
+        yield i
+
+
+@functools.lru_cache(maxsize=SEARCH_PATTERN_CACHE_SIZE)
+def compileSearchRE(
+    matchStr: str,
+    wordInitial: Literal["ok", "only", "no"] = "ok",
+    wordFinal: Literal["ok", "only", "no"] = "ok",
+    spanSyllable: Literal["ok", "only", "no"] = "ok",
+    stressedSyllable: Literal["ok", "only", "no"] = "ok",
+    exactMatch: bool = False,
+) -> "re.Pattern[str]":
+    """Prepares and compiles a user's RE string for a search
+
+    The most recently used patterns are cached, so repeating a search
+    doesn't prepare the same RE again.  See getCacheInfo() and clearCache().
+    """
+    return re.compile(
+        _prepRESearchStr(
+            matchStr, wordInitial, wordFinal, spanSyllable, stressedSyllable, exactMatch
+        )
+    )
+
+
+def getCacheInfo():
+    """Get the hit and miss statistics of the compiled pattern cache
+
+    Returns:
+        a named tuple with the fields hits, misses, maxsize, and currsize
+    """
+    return compileSearchRE.cache_info()
+
+
+def clearCache() -> None:
+    """Empty the compiled pattern cache and reset its statistics"""
+    compileSearchRE.cache_clear()
 
 
 # def _overlapInStress(word, match):
 
 
+def _extractLiteralFragments(matchStr: str) -> List[str]:
+    """Finds sequences of characters that every match of a prepared RE must contain
+
+    The RE should come from _prepRESearchStr().  Syllable boundaries and
+    diacritics are skipped over (they are optional between every character
+    in most prepared REs), so a fragment is only guaranteed to appear in a
+    matching pronunciation after those have been removed.
+
+    Returns an empty list if no fragments could be found.
+    """
+    diacritics = phonetic_constants.diacriticList
+
+    fragments: List[str] = []
+    run: List[str] = []
+
+    def endRun():
+        if len(run) > 0:
+            fragments.append("".join(run))
+            run.clear()
+
+    # The kind of the last element: a literal character, something that
+    # is skipped over (eg syllable boundaries), or anything else
+    LITERAL, SKIPPED, OTHER = range(3)
+    lastKind = OTHER
+    i = 0
+    while i < len(matchStr):
+        char = matchStr[i]
+        kind = OTHER
+
+        if char == "\\":
+            # An escaped '.' is a syllable boundary, which is skipped over
+            if matchStr[i + 1 : i + 2] == ".":
+                kind = SKIPPED
+            i += 2
+        elif char == "(":
+            # Lookarounds don't consume any characters
+            if matchStr.startswith(("(?=", "(?!", "(?<=", "(?<!"), i):
+                kind = SKIPPED
+            i = _findClosingBracket(matchStr, i) + 1
+        elif char == "[":
+            i = _findClosingBracket(matchStr, i) + 1
+        elif char in "*?{+":
+            end = matchStr.find("}", i) if char == "{" else i
+            if end == -1:
+                # An unclosed '{' is matched literally; don't try to find
+                # fragments around it
+                return []
+            kind = lastKind
+            if lastKind == LITERAL:
+                # The last character might not be present
+                if char != "+":
+                    run.pop()
+                kind = OTHER
+            i = end + 1
+            # Non-greedy quantifiers
+            if matchStr[i : i + 1] == "?":
+                i += 1
+        elif char == "|":
+            # Alternation at the top level--no fragments are required
+            return []
+        elif char in "^$" or char in diacritics:
+            kind = SKIPPED
+            i += 1
+        elif char != ".":
+            run.append(char)
+            kind = LITERAL
+            i += 1
+        else:
+            i += 1
+
+        if kind == OTHER:
+            endRun()
+        lastKind = kind
+    endRun()
+
+    return fragments
+
+
+def _findClosingBracket(matchStr: str, start: int) -> int:
+    """Finds the end of a group or character class that begins at start"""
+    if matchStr[start] == "[":
+        i = start + 1
+        # A ']' at the start of a class is a literal
+        if matchStr[i : i + 1] == "^":
+            i += 1
+        if matchStr[i : i + 1] == "]":
+            i += 1
+        while matchStr[i] != "]":
+            i += 2 if matchStr[i] == "\\" else 1
+        return i
+
+    depth = 0
+    i = start
+    while True:
+        char = matchStr[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "[":
+            i = _findClosingBracket(matchStr, i) + 1
+            continue
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+
+
 def _prepRESearchStr(
     matchStr: str,
     wordInitial: Literal["ok", "only", "no"] = "ok",
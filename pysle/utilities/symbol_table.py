@@ -0,0 +1,105 @@
+# encoding: utf-8
+"""A table of phoneme symbols, shared by every pronunciation
+
+Pronunciations read from a dictionary use a few dozen distinct phonemes
+many times over.  Interning them through the table means that every
+occurrence of a phoneme is the same str object, and gives each phoneme
+a small integer code, for when a compact array is more useful than a
+list of strings.
+"""
+
+import array
+from typing import Dict, Iterable, List
+
+from pysle.utilities import phonetic_constants
+
+# Codes are stored in unsigned shorts (array typecode 'H'); the last code
+# is reserved for symbols that aren't in the table
+MAX_NUM_SYMBOLS = (1 << 16) - 1
+UNKNOWN_CODE = MAX_NUM_SYMBOLS
+
+
+class PhonemeSymbolTable:
+    """Assigns a code to each distinct phoneme symbol
+
+    The table starts with phonetic_constants.charList; symbols not seen
+    before, such as phonemes with diacritics, are added as they are
+    interned.
+
+    Attributes:
+        symbols: the symbol for each code
+    """
+
+    def __init__(self, symbols: Iterable[str]):
+        self.symbols: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+        for symbol in symbols:
+            self.getCode(symbol)
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._codes
+
+    def getCode(self, symbol: str) -> int:
+        """Get the code for a symbol, adding it to the table if needed"""
+        code = self._codes.get(symbol)
+        if code is None:
+            code = len(self.symbols)
+            if code >= MAX_NUM_SYMBOLS:
+                raise ValueError(
+                    f"Can't add '{symbol}'; the table is limited to "
+                    f"{MAX_NUM_SYMBOLS} symbols"
+                )
+            self.symbols.append(symbol)
+            self._codes[symbol] = code
+
+        return code
+
+    def lookupCode(self, symbol: str) -> int:
+        """Get the code for a symbol, or UNKNOWN_CODE; the table isn't changed"""
+        return self._codes.get(symbol, UNKNOWN_CODE)
+
+    def intern(self, phonemes: Iterable[str]) -> List[str]:
+        """Replace each phoneme with the table's copy of the same symbol
+
+        Once the table is full, new symbols are returned as they are.
+        """
+        symbols = self.symbols
+        codes = self._codes
+
+        interned = []
+        for phone in phonemes:
+            code = codes.get(phone)
+            if code is None:
+                if len(symbols) >= MAX_NUM_SYMBOLS:
+                    interned.append(phone)
+                    continue
+                code = self.getCode(phone)
+            interned.append(symbols[code])
+
+        return interned
+
+    def encode(self, phonemes: Iterable[str], addMissing: bool = True) -> array.array:
+        """Convert phonemes to an array of codes
+
+        Args:
+            phonemes: the phonemes to convert
+            addMissing: if True, symbols that aren't in the table are added;
+                if False, they are given UNKNOWN_CODE
+
+        Returns:
+            the code of each phoneme
+        """
+        getCode = self.getCode if addMissing else self.lookupCode
+        return array.array("H", [getCode(phone) for phone in phonemes])
+
+    def decode(self, codes: Iterable[int]) -> List[str]:
+        """Convert codes back to phonemes; UNKNOWN_CODE can't be converted"""
+        symbols = self.symbols
+        return [symbols[code] for code in codes]
+
+
+phonemeTable = PhonemeSymbolTable(phonetic_constants.charList)
@@ -1,12 +1,18 @@
 # encoding: utf-8
 
 import itertools
-from typing import NoReturn, Type
+from typing import Iterable, NoReturn, Optional, Type
 
 from typing_extensions import Literal
 
 from pysle.utilities import errors
 from pysle.utilities import constants
+from pysle.utilities import phonetic_constants
+
+_posBits = {pos: 1 << i for i, pos in enumerate(phonetic_constants.posList)}
+
+# Set for entries with tags that are not in the Penn tagset
+POS_OTHER_BIT = 1 << len(phonetic_constants.posList)
 
 
 def _reportNoop(_exception: Type[BaseException], _text: str) -> None:
@@ -36,6 +42,92 @@ def getErrorReporter(reportingMode: Literal["silence", "warning", "error"]):
     return modeToFunc[reportingMode]
 
 
+def getPosBitmask(posList: Iterable[str]) -> int:
+    """Encodes a list of part of speech tags as a bitmask
+
+    Each tag in the Penn tagset (phonetic_constants.posList) gets its own bit.
+    All other tags share POS_OTHER_BIT.  Empty tags are ignored.
+    """
+    mask = 0
+    for pos in posList:
+        if pos != "":
+            mask |= _posBits.get(pos, POS_OTHER_BIT)
+
+    return mask
+
+
+def getPosQueryBitmask(pos: str) -> Optional[int]:
+    """Get a bitmask for entries whose posList string may contain pos
+
+    The search functions check for pos as a substring of an entry's
+    comma-separated posList.  An entry can only match if it has a tag
+    that contains pos or a tag outside of the Penn tagset.
+
+    Returns None if pos could match any entry (e.g. it contains a comma).
+    """
+    if pos == "" or "," in pos:
+        return None
+
+    mask = POS_OTHER_BIT
+    for tag, bit in _posBits.items():
+        if pos in tag:
+            mask |= bit
+
+    return mask
+
+
+# Above this many cells (len(xs) * len(ys)), the LCS is found with
+# Hirschberg's algorithm, which needs linear rather than quadratic memory
+LCS_TABLE_MAX_CELLS = 250_000
+
+
+def getLongestCommonSubsequence(xs: list, ys: list) -> list:
+    """Finds the longest common subsequence of two sequences
+
+    Word-length sequences are handled with a full dynamic programming
+    table and a traceback; long sequences fall back to Hirschberg's
+    algorithm.  Both return the same subsequence when there is a tie.
+    """
+    if len(xs) * len(ys) > LCS_TABLE_MAX_CELLS:
+        return _lcs(xs, ys)
+
+    return _lcsTable(xs, ys)
+
+
+def _lcsTable(xs: list, ys: list) -> list:
+    # table[i][j] is the length of the LCS of xs[:i] and ys[:j]
+    prev = [0] * (len(ys) + 1)
+    table = [prev]
+    for x in xs:
+        curr = [0]
+        for j, y in enumerate(ys):
+            if x == y:
+                curr.append(prev[j] + 1)
+            else:
+                up = prev[j + 1]
+                left = curr[j]
+                curr.append(up if up >= left else left)
+        table.append(curr)
+        prev = curr
+
+    # Matches are taken as soon as they are seen and, on a tie, x is
+    # skipped before y; this picks the same subsequence as _lcs()
+    sequence = []
+    i, j = len(xs), len(ys)
+    while i > 0 and j > 0:
+        if xs[i - 1] == ys[j - 1]:
+            sequence.append(xs[i - 1])
+            i -= 1
+            j -= 1
+        elif table[i - 1][j] >= table[i][j - 1]:
+            i -= 1
+        else:
+            j -= 1
+    sequence.reverse()
+
+    return sequence
+
+
 # The LCS code doesn't look like the rest of the code
 # -- I'm guessing I copied or adapted the code from
 #    someplace online
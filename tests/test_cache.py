@@ -0,0 +1,56 @@
+import unittest
+
+from pysle.utilities import cache
+from pysle.utilities import errors
+
+
+class TestBoundedCache(unittest.TestCase):
+    def test_lru_evicts_the_least_recently_used_item(self):
+        sut = cache.BoundedCache(2, "lru")
+        sut["a"] = 1
+        sut["b"] = 2
+        sut["a"]
+        sut["c"] = 3
+
+        self.assertEqual({"a": 1, "c": 3}, sut)
+        self.assertEqual(cache.CacheInfo(1, 0, 1, 2, 2), sut.cacheInfo())
+
+    def test_fifo_evicts_the_oldest_item(self):
+        sut = cache.BoundedCache(2, "fifo")
+        sut["a"] = 1
+        sut["b"] = 2
+        sut["a"]
+        sut["c"] = 3
+
+        self.assertEqual({"b": 2, "c": 3}, sut)
+
+    def test_get_counts_hits_and_misses(self):
+        sut = cache.BoundedCache()
+        sut["a"] = 1
+
+        self.assertEqual(1, sut.get("a"))
+        self.assertIsNone(sut.get("b"))
+        self.assertTrue("b" not in sut)
+        self.assertEqual(cache.CacheInfo(1, 1, 0, None, 1), sut.cacheInfo())
+
+    def test_peek_does_not_count_or_reorder(self):
+        sut = cache.BoundedCache(2, "lru")
+        sut["a"] = 1
+        sut["b"] = 2
+
+        self.assertEqual(1, sut.peek("a"))
+        self.assertIsNone(sut.peek("c"))
+        sut["c"] = 3
+
+        self.assertEqual({"b": 2, "c": 3}, sut)
+        self.assertEqual(cache.CacheInfo(0, 0, 1, 2, 2), sut.cacheInfo())
+
+    def test_a_cache_of_size_zero_holds_nothing(self):
+        sut = cache.BoundedCache(0)
+        sut["a"] = 1
+
+        self.assertEqual(0, len(sut))
+
+    def test_invalid_policy_raises_error(self):
+        with self.assertRaises(errors.WrongOptionError):
+            cache.BoundedCache(10, "random")
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from typing import List
 
@@ -111,6 +112,38 @@ class TestEntry(unittest.TestCase):
             ).phonemeList.phonemes,
         )
 
+    def test_phoneme_list_is_computed_once(self):
+        sut = entry(phoneList=[[["p", "ʌ", "m"]], [["p", "ˈɑ", "ɹ"]]])
+
+        self.assertIs(sut.phonemeList, sut.phonemeList)
+        self.assertTrue(sut.hasStress)
+
+    def test_pickling_saves_only_the_defining_fields(self):
+        sut = entry(phoneList=[[["p", "ʌ", "m"]], [["p", "ˈɑ", "ɹ"]]])
+        self.assertTrue(sut.hasStress)
+        sut.syllabificationList[0].desyllabify()
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            pickled = pickle.dumps(sut, protocol)
+            self.assertNotIn(b"_phonemeList", pickled)
+            self.assertNotIn(b"_vowelMask", pickled)
+
+            unpickled = pickle.loads(pickled)
+            self.assertEqual(sut, unpickled)
+            self.assertEqual(sut.phonemeList, unpickled.phonemeList)
+            self.assertEqual(
+                ["ʌ", "ˈɑ"],
+                [
+                    syllabification.syllables[0].nucleus
+                    for syllabification in unpickled.syllabificationList
+                ],
+            )
+
+            phonemeList = sut.phonemeList
+            self.assertEqual(
+                phonemeList, pickle.loads(pickle.dumps(phonemeList, protocol))
+            )
+
     def test_to_list(self):
         self.assertEqual(
             [
@@ -1,9 +1,13 @@
 import unittest
 import os
+import tempfile
 from typing import Dict, List
+from unittest import mock
 
 from pysle import phonetics
+from pysle.utilities import constants
 from pysle.utilities import isle_io
+from tests.testing_utils import copyIsleSample
 
 root = os.path.dirname(os.path.realpath(__file__))
 dataRoot = os.path.join(root, "files")
@@ -55,6 +59,17 @@ class TestIO(unittest.TestCase):
         )
         self.assertEqual(secondExpectedEntry, entries[1])
 
+    def test_raw_line_helpers_agree_with_the_parsed_entries(self):
+        linesByWord = isle_io.readIsleDict(os.path.join(dataRoot, "isle_sample.txt"))
+
+        for word, lines in linesByWord.items():
+            for line, entry in zip(lines, lazyLoadValue(word, linesByWord)):
+                self.assertEqual(entry.posList, isle_io.getPosListFromLine(line))
+                self.assertEqual(
+                    len(entry.syllabificationList),
+                    isle_io.getWordCountFromLine(line),
+                )
+
     def test_can_read_multiword_entries(self):
         sut = isle_io.readIsleDict(os.path.join(dataRoot, "isle_sample.txt"))
 
@@ -74,3 +89,106 @@ class TestIO(unittest.TestCase):
         )
 
         self.assertEqual(expectedEntry, entry)
+
+    def test_compiled_isle_dict_matches_the_original(self):
+        islePath = copyIsleSample(self)
+        compiledPath = os.path.join(os.path.dirname(islePath), "isle_sample.compiled")
+        isle_io.compileIsleDict(islePath, compiledPath)
+        sut = isle_io.loadCompiledIsleDict(islePath, compiledPath)
+
+        self.assertEqual(isle_io.readIsleDict(islePath), sut)
+
+    def test_stale_compiled_isle_dict_is_rebuilt(self):
+        islePath = copyIsleSample(self)
+
+        sut = isle_io.loadCompiledIsleDict(islePath)
+        self.assertTrue(os.path.exists(isle_io.getCompiledPath(islePath)))
+        self.assertNotIn("zebra", sut)
+
+        with open(islePath, "a", encoding="utf-8") as fd:
+            fd.write("zebra(nn) # z ˈi . b ɹ ə #\n")
+
+        sut = isle_io.loadCompiledIsleDict(islePath)
+        self.assertEqual(["zebra(nn) # z ˈi . b ɹ ə #\n"], sut["zebra"])
+
+    def test_compiled_files_go_in_the_user_cache(self):
+        islePath = os.path.join(dataRoot, "isle_sample.txt")
+        with tempfile.TemporaryDirectory() as tmpDir:
+            with mock.patch.dict(os.environ, {constants.CACHE_DIR_ENV_VAR: tmpDir}):
+                compiledPath = isle_io.getCompiledPath(constants.DEFAULT_ISLE_DICT_PATH)
+                packedPath = isle_io.getPackedPath(constants.DEFAULT_ISLE_DICT_PATH)
+                sampleCompiledPath = isle_io.getCompiledPath(islePath)
+                otherCompiledPath = isle_io.getCompiledPath(
+                    os.path.join(tmpDir, "isle_sample.txt")
+                )
+
+        self.assertEqual(tmpDir, os.path.dirname(compiledPath))
+        self.assertTrue(compiledPath.endswith(constants.COMPILED_ISLE_DICT_EXT))
+        self.assertEqual(tmpDir, os.path.dirname(packedPath))
+
+        # Nothing is written next to a user's dictionary
+        self.assertEqual(tmpDir, os.path.dirname(sampleCompiledPath))
+        self.assertNotEqual(sampleCompiledPath, otherCompiledPath)
+
+    def test_compiling_does_not_write_next_to_the_dictionary(self):
+        islePath = copyIsleSample(self)
+        isle_io.loadCompiledIsleDict(islePath)
+        isle_io.loadPackedIsleDict(islePath).close()
+
+        self.assertEqual(["isle.txt"], os.listdir(os.path.dirname(islePath)))
+
+    def test_unwritable_directory_is_checked_before_compiling(self):
+        islePath = copyIsleSample(self)
+
+        try:
+            with mock.patch.object(
+                isle_io.os, "access", return_value=False
+            ), mock.patch.object(isle_io, "getFileSignature") as getSignature:
+                sut = isle_io.loadCompiledIsleDict(islePath)
+
+                getSignature.assert_not_called()
+                self.assertEqual(isle_io.readIsleDict(islePath), sut)
+                self.assertFalse(os.path.exists(isle_io.getCompiledPath(islePath)))
+        finally:
+            isle_io._unwritableDirs.clear()
+
+    def test_failed_writes_are_not_retried(self):
+        islePath = copyIsleSample(self)
+
+        try:
+            with mock.patch.object(
+                isle_io.os, "replace", side_effect=PermissionError
+            ) as replace:
+                isle_io.loadCompiledIsleDict(islePath)
+                sut = isle_io.loadCompiledIsleDict(islePath)
+
+            self.assertEqual(1, replace.call_count)
+            self.assertEqual(isle_io.readIsleDict(islePath), sut)
+        finally:
+            isle_io._unwritableDirs.clear()
+
+    def test_packed_isle_dict_matches_the_original(self):
+        islePath = os.path.join(dataRoot, "isle_sample.txt")
+        lexDict = isle_io.readIsleDict(islePath)
+        sut = isle_io.PackedIsleDict(isle_io.packIsleDict(lexDict))
+
+        self.assertEqual(len(lexDict), len(sut))
+        self.assertEqual(lexDict, dict(sut.items()))
+        self.assertEqual(lexDict["with"], sut["with"])
+
+        # Words are iterated in the order of the file, as they are for a dict
+        self.assertNotEqual(sorted(lexDict.keys()), list(lexDict.keys()))
+        self.assertEqual(list(lexDict.keys()), list(sut.keys()))
+        self.assertEqual(list(lexDict.items()), list(sut.items()))
+
+        self.assertIn("pumpkins_parley", sut)
+        self.assertNotIn("pumpkin", sut)
+        self.assertIsNone(sut.get("pumpkin"))
+
+    def test_load_packed_isle_dict_memory_maps_a_packed_copy(self):
+        islePath = copyIsleSample(self)
+
+        sut = isle_io.loadPackedIsleDict(islePath)
+        self.assertTrue(os.path.exists(isle_io.getPackedPath(islePath)))
+        self.assertEqual(isle_io.readIsleDict(islePath), dict(sut.items()))
+        sut.close()
@@ -1,9 +1,16 @@
+import gc
+import pickle
+import sys
 import unittest
 
 from pysle import isletool
 from pysle import phonetics
 from pysle.utilities import errors
+from pysle.utilities import columns
 from pysle.utilities import constants
+from pysle.utilities import symbol_table
+from pysle.utilities import isle_io
+from tests.testing_utils import copyIsleSample
 
 
 class VirtualIsle(isletool.Isle):
@@ -43,6 +50,179 @@ class TestIsle(unittest.TestCase):
         # The number of unique words in the built-in dictionary
         self.assertEqual(254_430, len(sut.rawData.keys()))
 
+    def test_corrupt_compiled_dictionary_is_rebuilt(self):
+        islePath = copyIsleSample(self)
+        compiledPath = isle_io.getCompiledPath(islePath)
+        expectedEntries = isletool.Isle(islePath).lookup("another")
+        with open(compiledPath, "rb") as fd:
+            compiled = fd.read()
+
+        header = {
+            "format": isle_io.COMPILED_DICT_FORMAT,
+            **isle_io.getFileSignature(islePath),
+        }
+        for corruptCompiled in [
+            b"garbage",
+            compiled[: len(compiled) // 2],
+            # Refers to a class that doesn't exist
+            pickle.dumps(header) + b"cpysle.isletool\nNoSuchClass\n.",
+        ]:
+            with open(compiledPath, "wb") as fd:
+                fd.write(corruptCompiled)
+
+            sut = isletool.Isle(islePath)
+            self.assertEqual(expectedEntries, sut.lookup("another"))
+            with open(compiledPath, "rb") as fd:
+                self.assertEqual(compiled, fd.read())
+
+    def test_mmap_backend_gives_the_same_results_as_the_dict_backend(self):
+        islePath = copyIsleSample(self)
+
+        dictIsle = isletool.Isle(islePath, useCompiledDict=False)
+        sut = isletool.Isle(islePath, backend="mmap")
+
+        self.assertEqual(dictIsle.lookup("another"), sut.lookup("another"))
+        self.assertTrue(sut.contains("pumpkins_parley"))
+        self.assertFalse(sut.contains("pumpkin"))
+        self.assertEqual(
+            [entry.word for entry in dictIsle.getEntries()],
+            [entry.word for entry in sut.getEntries()],
+        )
+        sut.close()
+
+    @unittest.skipIf(sys.version_info < (3, 8), "shared_memory requires Python 3.8")
+    def test_attach_shared_gives_the_same_results_as_the_original(self):
+        sharedMemory = self.isle.toSharedMemory()
+        try:
+            with VirtualIsle.attachShared(sharedMemory.name) as sut:
+                self.assertEqual(self.isle.lookup("another"), sut.lookup("another"))
+                self.assertEqual(
+                    list(self.isle.rawData.items()), list(sut.rawData.items())
+                )
+        finally:
+            sharedMemory.close()
+            sharedMemory.unlink()
+
+    @unittest.skipIf(sys.version_info < (3, 8), "shared_memory requires Python 3.8")
+    def test_attached_isle_is_released_when_garbage_collected(self):
+        sharedMemory = self.isle.toSharedMemory()
+        try:
+            sut = VirtualIsle.attachShared(sharedMemory.name)
+            sut.lookup("cat")
+            finalizer = sut.rawData._finalizer
+
+            del sut
+            gc.collect()
+
+            self.assertFalse(finalizer.alive)
+        finally:
+            sharedMemory.close()
+            sharedMemory.unlink()
+
+    @unittest.skipIf(sys.version_info >= (3, 8), "shared_memory exists")
+    def test_to_shared_memory_raises_error_before_python_3_8(self):
+        with self.assertRaises(errors.SharedMemoryNotSupportedError):
+            self.isle.toSharedMemory()
+
+    def test_iter_entries_does_not_fill_the_cache(self):
+        sut = list(self.isle.iterEntries())
+
+        self.assertEqual(
+            ["another", "another", "brown", "brown_cat", "cat"],
+            [entry.word for entry in sut],
+        )
+        self.assertEqual(0, len(self.isle.data))
+        self.assertEqual(sut, list(self.isle.getEntries()))
+        self.assertEqual((0, 0), tuple(self.isle.getCacheInfo())[:2])
+
+    def test_iter_entries_with_cache(self):
+        sut = list(self.isle.iterEntries(useCache=True))
+
+        self.assertEqual(4, len(self.isle.data))
+        self.assertIs(self.isle.lookup("cat")[0], sut[-1])
+
+    def test_iter_entries_reuses_cached_entries(self):
+        cat = self.isle.lookup("cat")[0]
+
+        self.assertIs(cat, list(self.isle.iterEntries())[-1])
+        self.assertEqual((0, 1), tuple(self.isle.getCacheInfo())[:2])
+
+    def test_iter_entries_with_a_filter(self):
+        self.isle.lookup("another")
+        sut = self.isle.iterEntries(
+            wordFilter=lambda line: "ə ɹ #" in line or "b ɹ" in line
+        )
+
+        self.assertEqual(
+            [
+                [[["ə"], ["n", "ˈʌ", "ð"], ["ə", "ɹ"]]],
+                [[["b", "ɹ", "ˈaʊ", "n"]]],
+                [[["b", "ɹ", "ˈaʊ", "n"]], [["k", "ˌæ", "t˺"]]],
+            ],
+            [entry.toList() for entry in sut],
+        )
+
+    def test_iter_entries_with_pos_filter(self):
+        sut = self.isle.iterEntries(wordFilter=isletool.posFilter("nn"))
+
+        self.assertEqual(["another", "another", "cat"], [entry.word for entry in sut])
+
+    def test_iter_entries_with_multiword_filter(self):
+        onlyMultiword = self.isle.iterEntries(
+            wordFilter=isletool.multiwordFilter("only")
+        )
+        noMultiword = self.isle.iterEntries(wordFilter=isletool.multiwordFilter("no"))
+
+        self.assertEqual(["brown_cat"], [entry.word for entry in onlyMultiword])
+        self.assertEqual(4, len(list(noMultiword)))
+
+    def test_multiword_filter_raises_error_with_invalid_option(self):
+        with self.assertRaises(errors.WrongOptionError):
+            isletool.multiwordFilter("maybe")
+
+    def test_to_columns_matches_the_parsed_entries(self):
+        sut = self.isle.toColumns()
+        entries = list(self.isle.getEntries())
+
+        self.assertEqual(["another", "brown", "brown_cat", "cat"], sut.words)
+        self.assertEqual([0, 0, 1, 2, 3], list(sut.entryWordIds))
+        self.assertEqual(len(entries) + 1, len(sut.entrySyllableOffsets))
+
+        syllableI = 0
+        for i, entry in enumerate(entries):
+            self.assertEqual(entry.word, sut.words[sut.entryWordIds[i]])
+            syllables = [
+                syllable
+                for syllabification in entry.syllabificationList
+                for syllable in syllabification.syllables
+            ]
+            self.assertEqual(
+                len(syllables),
+                sut.entrySyllableOffsets[i + 1] - sut.entrySyllableOffsets[i],
+            )
+
+            for syllable in syllables:
+                start = sut.syllablePhonemeOffsets[syllableI]
+                end = sut.syllablePhonemeOffsets[syllableI + 1]
+                self.assertEqual(
+                    syllable.phonemes,
+                    symbol_table.phonemeTable.decode(sut.phonemeCodes[start:end]),
+                )
+                self.assertEqual(
+                    syllable.hasStress,
+                    bool(sut.syllableFlags[syllableI] & columns.PRIMARY_STRESS),
+                )
+                syllableI += 1
+
+        # brown_cat is made of two words
+        brownCatSyllables = sut.syllableFlags[
+            sut.entrySyllableOffsets[3] : sut.entrySyllableOffsets[4]
+        ]
+        self.assertEqual(
+            [True, True],
+            [bool(flags & columns.WORD_START) for flags in brownCatSyllables],
+        )
+
     def test_lookup(self):
         sut = self.isle.lookup("cat")
         self.assertEqual(1, len(sut))
@@ -78,6 +258,51 @@ class TestIsle(unittest.TestCase):
             sut[1],
         )
 
+    def test_entry_cache_can_be_bounded(self):
+        sut = VirtualIsle(entryCacheSize=2, cachePolicy="lru")
+        sut.lookup("cat")
+        sut.lookup("brown")
+        sut.lookup("cat")
+        sut.lookup("another")
+
+        self.assertEqual(["cat", "another"], list(sut.data.keys()))
+        self.assertEqual(1, sut.getCacheInfo().evictions)
+        self.assertEqual(2, sut.getCacheInfo().currsize)
+
+    def test_words_with_no_entries_are_cached(self):
+        sut = VirtualIsle()
+        sut.rawData["empty"] = []
+
+        self.assertEqual([], sut.lookup("empty"))
+        self.assertEqual([], sut.lookup("empty"))
+        self.assertEqual(1, sut.getCacheInfo().hits)
+        self.assertEqual(1, sut.getCacheInfo().misses)
+
+    def test_out_of_dictionary_words_are_cached(self):
+        sut = VirtualIsle()
+        for _ in range(3):
+            with self.assertRaises(errors.WordNotInIsleError) as cm:
+                sut.lookup("bird")
+            self.assertEqual("bird", cm.exception.word)
+
+        self.assertEqual(2, sut.getNegativeCacheInfo().hits)
+        self.assertEqual(1, sut.getNegativeCacheInfo().currsize)
+
+    def test_cached_out_of_dictionary_words_raise_a_new_error(self):
+        sut = VirtualIsle()
+        with self.assertRaises(errors.WordNotInIsleError) as first:
+            sut.lookup("bird")
+
+        try:
+            raise KeyError("unrelated")
+        except KeyError:
+            with self.assertRaises(errors.WordNotInIsleError) as second:
+                sut.lookup("bird")
+
+        self.assertIsNot(first.exception, second.exception)
+        self.assertIsNone(first.exception.__context__)
+        self.assertEqual(1, sut.getNegativeCacheInfo().hits)
+
     def test_get_length_when_get_max_is_false(self):
         # When "getMax" is false, the average number of phones and syllables
         # is used instead
@@ -88,6 +313,36 @@ class TestIsle(unittest.TestCase):
         self.assertEqual((1, 3), self.isle.getLength("cat", True))
         self.assertEqual((3, 6), self.isle.getLength("another", True))
 
+    def test_get_length_of_multiword_entry(self):
+        self.assertEqual((2, 7), self.isle.getLength("brown_cat", False))
+
+    def test_get_length_when_word_is_not_in_isle(self):
+        with self.assertRaises(errors.WordNotInIsleError):
+            self.isle.getLength("bird", False)
+
+    def test_get_length_does_not_parse_entries(self):
+        self.isle.getLength("another", True)
+        self.isle.getLength("Another", False)
+
+        self.assertEqual(0, self.isle.getCacheInfo().currsize)
+        self.assertEqual({"another": 0}, self.isle._lengthRows)
+
+    def test_get_length_stats(self):
+        self.assertEqual(
+            isletool.WordLengths(3, 3, 3, 5, 6, 5.5),
+            self.isle.getLengthStats("another"),
+        )
+
+    def test_get_length_many(self):
+        self.assertEqual(
+            {"another": (3, 6), "cat": (1, 3)},
+            self.isle.getLengthMany(["another", "bird", "cat", "cat"], True),
+        )
+        self.assertEqual(
+            {"another": (3, 5.5), "CAT": (1, 3)},
+            self.isle.getLengthMany(["another", "bird", "CAT"], False),
+        )
+
     def test_contains(self):
         self.assertEqual(True, self.isle.contains("cat"))
         self.assertEqual(True, self.isle.contains("another"))
@@ -95,6 +350,23 @@ class TestIsle(unittest.TestCase):
         self.assertEqual(False, self.isle.contains("bird"))
         self.assertEqual(False, self.isle.contains("house"))
 
+        # Checking membership doesn't parse any entries
+        self.assertEqual({}, self.isle.data)
+
+    def test_contains_many(self):
+        self.assertEqual(
+            {"cat": True, "bird": False, "Another ": True},
+            self.isle.containsMany(["cat", "bird", "cat", "Another ", "bird"]),
+        )
+        self.assertEqual({}, self.isle.data)
+
+    def test_lookup_many(self):
+        sut = self.isle.lookupMany(["cat", "bird", "CAT", "cat"])
+
+        self.assertEqual(["cat", "CAT"], list(sut.keys()))
+        self.assertEqual(self.isle.lookup("cat"), sut["cat"])
+        self.assertEqual(self.isle.lookup("cat"), sut["CAT"])
+
     def test_find_best_syllabification(self):
         firstMatch = self.isle.findBestSyllabification("another", ["ə", "n", "ˈʌ"])
         self.assertEqual([["ə"], ["n", "ˈʌ"]], firstMatch.toList())
@@ -109,6 +381,48 @@ class TestIsle(unittest.TestCase):
         )
         self.assertEqual([["ə"], ["n", "ˈʌ", "d"], ["ə", "ɹ"]], threeMatch.toList())
 
+    def test_find_best_syllabification_for_inflected_words(self):
+        catEntries = self.isle.lookup("cat")
+        originalCat = catEntries[0].toList()
+
+        sut = self.isle.findBestSyllabification("cat's", ["k", "æ", "t", "s"])
+        self.assertEqual([["k", "æ", "t", "s"]], sut.toList())
+
+        sut = self.isle.findBestSyllabification(
+            "another'll", ["ə", "n", "ˈʌ", "ð", "ɚ", "l"]
+        )
+        self.assertEqual([["ə"], ["n", "ˈʌ"], ["ð", "ɚ", "l"]], sut.toList())
+
+        # The entries in the dictionary are left as they were
+        self.assertEqual(originalCat, self.isle.lookup("cat")[0].toList())
+        self.assertIs(catEntries, self.isle.lookup("cat"))
+
+        with self.assertRaises(errors.WordNotInIsleError):
+            self.isle.findBestSyllabification("bird's", ["b", "ɚ", "d", "z"])
+        with self.assertRaises(errors.WordNotInIsleError) as cm:
+            self.isle.findBestSyllabification("cats'", ["k", "æ", "t", "s"])
+        self.assertEqual("cats", cm.exception.word)
+        with self.assertRaises(errors.WordNotInIsleError):
+            self.isle.findBestSyllabification("catty", ["k", "æ", "t", "i"])
+
+    def test_find_best_syllabification_for_inflected_words_ending_in_sibilants(self):
+        class BusIsle(isletool.Isle):
+            def _load(self, _islePath):
+                return {"bus": ["bus(nn) # b ˈʌ s #"]}
+
+        sut = BusIsle().findBestSyllabification("bus's", ["b", "ʌ", "s", "ɪ", "z"])
+        self.assertEqual([["b", "ʌ", "s"], ["ɪ", "z"]], sut.toList())
+
+    def test_inflected_entries_are_derived_once(self):
+        self.isle.findBestSyllabification("brown's", ["b", "ɹ", "aʊ", "n", "z"])
+        self.isle.findBestSyllabification("brown's", ["b", "ɹ", "aʊ", "n", "z"])
+
+        self.assertEqual(1, len(self.isle._inflectedEntries))
+        self.assertEqual(
+            [[["b", "ɹ", "ˈaʊ", "n", "z"]]],
+            self.isle._inflectedEntries[("brown", "'s")][0].toList(),
+        )
+
     def test_find_closest_pronunciation(self):
         firstMatch = self.isle.findClosestPronunciation("another", ["ə", "n", "ˈʌ"])
         self.assertEqual(["ə", "n", "ˈʌ", "ð", "ɚ"], firstMatch.phonemeList.phonemes)
@@ -143,6 +457,36 @@ class TestIsle(unittest.TestCase):
             self.isle.transcribe("Another cat", constants.LengthOptions.LONGEST),
         )
 
+    def test_transcribe_with_oov_placeholder(self):
+        self.assertEqual(
+            "<unk> kæt˺ <unk>",
+            self.isle.transcribe("Hello cat world", oovPlaceholder="<unk>"),
+        )
+
+    def test_transcribe_caches_each_word_and_preference(self):
+        self.isle.transcribe("cat another cat")
+        self.isle.transcribe("Cat", constants.LengthOptions.LONGEST)
+
+        self.assertEqual(
+            {("cat", None), ("another", None), ("cat", "longest")},
+            set(self.isle._transcriptions.keys()),
+        )
+        self.assertEqual(1, self.isle.getTranscriptionCacheInfo().hits)
+
+    def test_transcribe_many(self):
+        sut = self.isle.transcribeMany(
+            iter(["Another cat", "brown bird"]),
+            constants.LengthOptions.LONGEST,
+            oovPlaceholder="?",
+        )
+
+        self.assertEqual("ənʌðəɹ kæt˺", next(sut))
+        self.assertEqual(["bɹaʊn ?"], list(sut))
+
+    def test_transcribe_many_raises_error_for_out_of_dictionary_words(self):
+        with self.assertRaises(errors.WordNotInIsleError):
+            list(self.isle.transcribeMany(["cat", "bird"]))
+
     def test_autopair(self):
         self.assertEqual(
             ([["another", "brown_cat", "brown"]], [1]),
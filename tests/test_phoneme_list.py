@@ -1,9 +1,12 @@
+import random
 import unittest
 from typing import List
 
 from pysle import phonetics
 from pysle.utilities import errors
 from pysle.utilities import constants
+from pysle.utilities import phonetic_constants
+
 
 # For the tests in this file, the word and part of speech information associated
 # with an entry don't matter
@@ -246,6 +249,129 @@ class TestPhonemeList(unittest.TestCase):
             ["''", "e", "t", "''", "''", "e", "g"], phoneList2Aligned.phonemes
         )
 
+    def test_align_with_the_alignment_cache(self):
+        phonetics.enableAlignmentCache(maxsize=1)
+        self.addCleanup(phonetics.disableAlignmentCache)
+        phoneList1 = phonetics.PhonemeList(["z", "a", "b", "c", "f", "a"])
+        phoneList2 = phonetics.PhonemeList(["e", "t", "e", "g"])
+
+        expected = phoneList1.align(phoneList2, simplifiedMatching=True)
+        actual = phoneList1.align(phoneList2, simplifiedMatching=True)
+        phoneList1.align(phoneList2, simplifiedMatching=False)
+
+        self.assertEqual(expected, actual)
+        self.assertIsNot(expected[0].phonemes, actual[0].phonemes)
+        self.assertEqual((1, 2, 1, 1, 1), tuple(phonetics.getAlignmentCacheInfo()))
+
+        phonetics.disableAlignmentCache()
+        self.assertIsNone(phonetics.getAlignmentCacheInfo())
+
+    def test_count_alignment_diffs_matches_the_fillers_in_the_alignment(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            phonesA = rng.choices(
+                ["p", "t", "ʌ", "ˈʌ", "u", "n̩", "n"], k=rng.randint(0, 7)
+            )
+            phonesB = rng.choices(
+                ["p", "t", "ʌ", "ˈʌ", "u", "n̩", "n"], k=rng.randint(0, 7)
+            )
+            for simplifiedMatching in [True, False]:
+                alignedA, alignedB = phonetics.alignPhones(
+                    phonesA, phonesB, simplifiedMatching
+                )
+                expected = alignedA.count(phonetic_constants.FILLER) + alignedB.count(
+                    phonetic_constants.FILLER
+                )
+
+                self.assertEqual(
+                    expected,
+                    phonetics._countAlignmentDiffs(
+                        phonesA, phonesB, simplifiedMatching
+                    ),
+                )
+
+    def test_count_alignment_diffs_uses_the_alignment_cache(self):
+        phonetics.enableAlignmentCache()
+        self.addCleanup(phonetics.disableAlignmentCache)
+        phonesA = ["z", "a", "b", "c", "f", "a"]
+        phonesB = ["e", "t", "e", "g"]
+
+        self.assertEqual(4, phonetics._countAlignmentDiffs(phonesA, phonesB, True))
+        self.assertEqual(4, phonetics._countAlignmentDiffs(phonesA, phonesB, True))
+        self.assertEqual(
+            (1, 1), tuple(phonetics.getAlignmentCacheInfo())[:2]  # hits, misses
+        )
+
+        sut = phonetics.PhonemeList(["p", "ʌ", "m", "k", "n̩"])
+        entries = [entry([[["p", "ʌ", "m"], ["k", "n̩"]]])]
+        sut.findClosestEntry(entries)
+        sut.findClosestEntry(entries)
+        # The winner's score and its adjustment share one alignment
+        self.assertEqual(
+            (4, 2), tuple(phonetics.getAlignmentCacheInfo())[:2]  # hits, misses
+        )
+
+    def test_find_closest_entry_matches_a_full_scan(self):
+        # Entries are skipped when their length alone rules them out; the
+        # result must be the same as scoring every entry
+        rng = random.Random(0)
+
+        def randomSyllable():
+            return (
+                rng.choices(["p", "k", "m"], k=rng.randint(0, 2))
+                + [rng.choice(["ʌ", "ˈʌ", "u", "ˌu"])]
+                + rng.choices(["n", "t"], k=rng.randint(0, 1))
+            )
+
+        def fullScan(sut, entries):
+            numDiffList = []
+            for candidate in entries:
+                alignedA, alignedB = sut.align(
+                    candidate.syllabificationList[0].desyllabify(),
+                    simplifiedMatching=True,
+                )
+                numDiffList.append(
+                    alignedA.phonemes.count(phonetic_constants.FILLER)
+                    + alignedB.phonemes.count(phonetic_constants.FILLER)
+                )
+            withStress = [candidate.hasStress for candidate in entries]
+            return entries[
+                phonetics._chooseMostSimilarWithStress(numDiffList, withStress)
+            ]
+
+        for useCache in [False, True]:
+            if useCache:
+                phonetics.enableAlignmentCache()
+                self.addCleanup(phonetics.disableAlignmentCache)
+
+            for _ in range(300):
+                sut = phonetics.PhonemeList(
+                    [
+                        phone
+                        for _ in range(rng.randint(1, 3))
+                        for phone in randomSyllable()
+                    ]
+                )
+                entries = [
+                    entry([[randomSyllable() for _ in range(rng.randint(1, 3))]])
+                    for _ in range(rng.randint(1, 6))
+                ]
+
+                self.assertIs(fullScan(sut, entries), sut.findClosestEntry(entries))
+
+    def test_find_closest_entry_breaks_ties_after_pruning(self):
+        sut = phonetics.PhonemeList(["p", "ʌ", "m", "k", "n̩"])
+
+        closeUnstressed = entry([[["p", "ʌ", "m"], ["k", "ɪ", "n"]]])
+        tooLongStressed = entry([[["p", "ˈʌ", "m", "p", "t"], ["k", "ɪ", "n", "t"]]])
+        closeStressed = entry([[["p", "ʌ", "m"], ["k", "ˈɪ", "n"]]])
+        entries = [closeUnstressed, tooLongStressed, closeStressed]
+
+        # The long entry is pruned without being aligned; of the two tied
+        # entries, the stressed one wins even though it comes later
+        self.assertIs(closeStressed, sut.findClosestEntry(entries))
+        self.assertIs(closeUnstressed, sut.findClosestEntry(entries[:2]))
+
     def test_find_closest_entry_will_pick_out_the_closest_entry(self):
         sut = phonetics.PhonemeList(["p", "ʌ", "m", "k", "n̩"])
 
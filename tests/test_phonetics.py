@@ -11,3 +11,34 @@ class TestPhonetics(unittest.TestCase):
     def test_is_vowel_for_nonvowels(self):
         for nonvowel in ["k", "v", "1", "'", "B"]:
             self.assertFalse(phonetics.isVowel(nonvowel))
+
+    def test_classification_is_the_same_when_memoized(self):
+        for phone in ["ˈæ", "t˺", "ɹ", "ɝ", "zz"]:
+            self.assertEqual(phonetics.isVowel(phone), phonetics.isVowel(phone))
+            self.assertEqual(phonetics.isRhotic(phone), phonetics.isRhotic(phone))
+
+        self.assertTrue(phonetics.isVowel("ˈæ"))
+        self.assertTrue(phonetics.isRhotic("ɹ"))
+        self.assertFalse(phonetics.isRhotic("t˺"))
+
+    def test_phone_caches_are_bounded(self):
+        phonetics.clearPhoneCaches()
+        for i in range(phonetics.PHONE_CACHE_SIZE + 10):
+            phonetics.isVowel(f"a{i}")
+            phonetics._simplifyPhone(f"k{i}")
+
+        cacheInfo = phonetics.getPhoneCacheInfo()
+        self.assertEqual(phonetics.PHONE_CACHE_SIZE, cacheInfo["isVowel"].currsize)
+        self.assertEqual(phonetics.PHONE_CACHE_SIZE, cacheInfo["simplify"].currsize)
+
+        phonetics.clearPhoneCaches()
+        cacheInfo = phonetics.getPhoneCacheInfo()
+        self.assertEqual(0, cacheInfo["isVowel"].currsize)
+        self.assertEqual(0, cacheInfo["isRhotic"].currsize)
+        self.assertEqual(0, cacheInfo["simplify"].currsize)
+
+    def test_simplify_phone(self):
+        self.assertEqual(
+            ["V", "t", "r", "V", "d"],
+            [phonetics._simplifyPhone(p) for p in ["ˈæ", "t˺", "ɹ", "ˌə", "dʒ"]],
+        )
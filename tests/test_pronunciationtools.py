@@ -0,0 +1,31 @@
+import unittest
+
+from pysle import phonetics
+from pysle import pronunciationtools
+
+
+class TestPronunciationTools(unittest.TestCase):
+    def setUp(self):
+        self.pairs = [
+            (["a", "b", "c", "d", "e", "f"], ["l", "a", "z", "d", "u"]),
+            (["k", "ˈæ", "t"], phonetics.PhonemeList(["k", "ˌæ", "t˺", "s"])),
+            ([], ["a"]),
+        ]
+
+    def test_align_many_matches_align_pronunciations(self):
+        for simplifiedMatching in [True, False]:
+            expected = [
+                pronunciationtools.alignPronunciations(a, b, simplifiedMatching)
+                for a, b in self.pairs
+            ]
+
+            self.assertEqual(
+                expected,
+                list(pronunciationtools.alignMany(self.pairs, simplifiedMatching)),
+            )
+
+    def test_align_many_across_worker_processes(self):
+        self.assertEqual(
+            list(pronunciationtools.alignMany(self.pairs)),
+            list(pronunciationtools.alignMany(self.pairs, processes=2, chunkSize=1)),
+        )
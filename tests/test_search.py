@@ -1,10 +1,17 @@
+import multiprocessing
+import os
 import unittest
 from typing import List
 
 from pysle import phonetics
 from pysle import isletool
 from pysle import praattools
+from pysle.utilities import constants
 from pysle.utilities import errors
+from pysle.utilities import isle_io
+from pysle.utilities import search
+from pysle.utilities import utils
+from tests.testing_utils import copyIsleSample
 
 
 class VirtualIsle(isletool.Isle):
@@ -158,3 +165,170 @@ class TestSearch(unittest.TestCase):
 
         self.assertEqual(1, len(results))
         self.assertEqual("brown", results[0]["word"])
+
+    def test_search_index_gives_the_same_results_as_a_word_info_list(self):
+        wordInfoList = self.isle._getSearchIndex().wordInfoList
+        searchIndex = search.SearchIndex(wordInfoList)
+
+        for kwargs in [
+            {},
+            {"stressedSyllable": "only"},
+            {"stressedSyllable": "no"},
+            {"exactMatch": True},
+        ]:
+            self.assertEqual(
+                list(search.search(wordInfoList, "Vt˺", **kwargs)),
+                list(search.search(searchIndex, "Vt˺", **kwargs)),
+            )
+
+    def test_search_index_is_only_built_once(self):
+        list(self.isle.search("kV"))
+        searchIndex = self.isle._getSearchIndex()
+        list(self.isle.search("NV"))
+
+        self.assertIs(searchIndex, self.isle._getSearchIndex())
+
+    def test_search_index_can_be_persisted(self):
+        islePath = copyIsleSample(self)
+
+        isle = isletool.Isle(islePath, persistSearchIndex=True)
+        expectedResults = list(isle.search("kV"))
+        self.assertTrue(
+            os.path.exists(isle_io.getCachePath(islePath, constants.SEARCH_INDEX_EXT))
+        )
+
+        sut = isletool.Isle(islePath, persistSearchIndex=True)
+        self.assertIsNotNone(sut._getSearchIndex()._ngramIndex)
+        self.assertEqual(expectedResults, list(sut.search("kV")))
+
+    def test_search_results_are_copies(self):
+        result = next(self.isle.search("kæt"))
+        result["word"] = "changed"
+
+        self.assertEqual(
+            ["brown_cat", "cat"],
+            [result["word"] for result in self.isle.search("kæt")],
+        )
+
+    def test_extract_literal_fragments_skips_syllable_boundaries_and_stress(self):
+        matchStr = search._prepRESearchStr("kæt#")
+        self.assertEqual(["kæt#"], search._extractLiteralFragments(matchStr))
+
+    def test_extract_literal_fragments_splits_on_special_characters(self):
+        matchStr = search._prepRESearchStr("bVn", wordInitial="only")
+        self.assertEqual(["#b", "n"], search._extractLiteralFragments(matchStr))
+
+    def test_extract_literal_fragments_drops_optional_characters(self):
+        self.assertEqual(["ab", "d"], search._extractLiteralFragments("abc?d"))
+        self.assertEqual(["abc", "d"], search._extractLiteralFragments("abc+d"))
+        self.assertEqual([], search._extractLiteralFragments("abc|d"))
+
+    def test_extract_literal_fragments_with_an_unclosed_brace(self):
+        self.assertEqual([], search._extractLiteralFragments("k{"))
+        self.assertEqual([], search._extractLiteralFragments("æ{2"))
+
+    def test_search_with_an_unclosed_brace(self):
+        self.assertEqual([], list(self.isle.search("k{")))
+        self.assertEqual([], list(self.isle.search("æ{2")))
+
+    def test_get_candidates_uses_the_ngram_index(self):
+        searchIndex = self.isle._getSearchIndex()
+
+        self.assertEqual(
+            ["brown_cat", "cat"],
+            [
+                searchIndex.wordInfoList[i]["word"]
+                for i in searchIndex.getCandidates(["kæt#"])
+            ],
+        )
+        self.assertEqual(len(searchIndex), len(searchIndex.getCandidates(["kæ"])))
+
+    def test_filter_entries_uses_the_precomputed_columns(self):
+        searchIndex = self.isle._getSearchIndex()
+        allEntries = list(range(len(searchIndex)))
+
+        def getWords(indexList):
+            return [searchIndex.wordInfoList[i]["word"] for i in indexList]
+
+        self.assertEqual(
+            allEntries, searchIndex.filterEntries(allEntries, None, "ok", None)
+        )
+        self.assertEqual(
+            ["any"], getWords(searchIndex.filterEntries(allEntries, 2, "ok", None))
+        )
+        self.assertEqual(
+            ["brown_cat"],
+            getWords(searchIndex.filterEntries(allEntries, None, "only", None)),
+        )
+        self.assertEqual(
+            ["another", "another", "cat", "nominee"],
+            getWords(searchIndex.filterEntries(allEntries, None, "no", "nn")),
+        )
+        self.assertEqual(
+            ["cat", "nominee"],
+            getWords(searchIndex.filterEntries([4, 5, 6], None, "ok", "nn")),
+        )
+
+    def test_compiled_patterns_are_cached(self):
+        search.clearCache()
+        self.assertEqual(0, search.getCacheInfo().currsize)
+
+        firstResults = list(self.isle.search("kæt", wordFinal="only"))
+        secondResults = list(self.isle.search("kæt", wordFinal="only"))
+        list(self.isle.search("kæt", wordFinal="no"))
+
+        cacheInfo = search.getCacheInfo()
+        self.assertEqual(firstResults, secondResults)
+        self.assertEqual(1, cacheInfo.hits)
+        self.assertEqual(2, cacheInfo.misses)
+        self.assertIs(
+            search.compileSearchRE("kæt", "ok", "only"),
+            search.compileSearchRE("kæt", "ok", "only"),
+        )
+
+        search.clearCache()
+        self.assertEqual(0, search.getCacheInfo().currsize)
+
+    def test_search_across_worker_processes(self):
+        for kwargs in [
+            {"searchString": "n"},
+            {"searchString": "kæt", "wordFinal": "only"},
+            {"searchString": "V", "numSyllables": 2, "pos": "nn"},
+        ]:
+            expectedWords = [result["word"] for result in self.isle.search(**kwargs)]
+            orderedWords = [
+                result["word"] for result in self.isle.search(workers=2, **kwargs)
+            ]
+            unorderedWords = [
+                result["word"]
+                for result in self.isle.search(workers=2, ordered=False, **kwargs)
+            ]
+
+            self.assertEqual(expectedWords, orderedWords)
+            self.assertEqual(sorted(expectedWords), sorted(unorderedWords))
+
+        with self.assertRaises(ValueError):
+            list(self.isle.search("n", workers=0))
+
+    def test_search_on_a_shared_pool(self):
+        expectedWords = [result["word"] for result in self.isle.search("n")]
+
+        with multiprocessing.Pool(2) as pool:
+            for _ in range(2):
+                results = list(self.isle.search("n", workers=2, pool=pool))
+                self.assertEqual(expectedWords, [result["word"] for result in results])
+                results[0]["word"] = "changed"
+
+    def test_pos_bitmasks(self):
+        catMask = utils.getPosBitmask(["dt", "nn", "prp"])
+        cadetsMask = utils.getPosBitmask(["+cadet+s", "nns"])
+
+        self.assertEqual(0, utils.getPosBitmask([""]))
+        self.assertEqual(0, catMask & utils.POS_OTHER_BIT)
+        self.assertNotEqual(0, cadetsMask & utils.POS_OTHER_BIT)
+
+        # 'nn' is part of 'nns' and 'nnp'
+        self.assertNotEqual(0, catMask & utils.getPosQueryBitmask("nn"))
+        self.assertNotEqual(0, cadetsMask & utils.getPosQueryBitmask("nn"))
+        self.assertEqual(0, catMask & utils.getPosQueryBitmask("vb"))
+        self.assertIsNone(utils.getPosQueryBitmask("dt,nn"))
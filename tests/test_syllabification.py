@@ -131,6 +131,28 @@ class TestSyllabification(unittest.TestCase):
             ).desyllabify(),
         )
 
+    def test_with_suffix(self):
+        sut = syllabification(syllables=[["k", "ˈæ", "t"]], stressedSyllables=[0])
+
+        self.assertEqual([["k", "ˈæ", "t", "s"]], sut.withSuffix(["s"]).toList())
+        self.assertEqual([0], sut.withSuffix(["s"]).stressedSyllableIndicies)
+
+    def test_with_suffix_with_a_vowel_adds_a_syllable(self):
+        sut = syllabification(syllables=[["b", "ˈʌ", "s"]]).withSuffix(["ɪ", "z"])
+
+        self.assertEqual([["b", "ˈʌ", "s"], ["ɪ", "z"]], sut.toList())
+        self.assertEqual(["ˈʌ", "ɪ"], [syllable.nucleus for syllable in sut.syllables])
+
+    def test_derived_values_are_computed_once(self):
+        sut = syllabification(syllables=[["l", "ˈæ"], ["b", "ɚ"], ["ˌɪ", "n", "ɵ"]])
+
+        self.assertIs(sut.desyllabify(), sut.desyllabify())
+        self.assertEqual([0, 2], sut.stress)
+
+        # Callers get their own copy of the stress list
+        sut.stress.append(5)
+        self.assertEqual([0, 2], sut.stress)
+
     def test_stretch_first_syllable_initial_pos(self):
         sut = phonetics.Syllabification([["p", "m"], ["k", "n"]])
         targetSyllabification = phonetics.Syllabification([["b", "p", "m"], ["k", "n"]])
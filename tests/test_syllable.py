@@ -32,3 +32,57 @@ class TestSyllable(unittest.TestCase):
             "one vowel.\n This was the CV mapping: 'CVV'",
             str(cm.exception),
         )
+
+    def test_vowel_bitmask_matches_the_list_based_values(self):
+        def listBasedCvList(phonemes):
+            return ["V" if phonetics.isVowel(phone) else "C" for phone in phonemes]
+
+        def listBasedNucleus(phonemes):
+            cvList = listBasedCvList(phonemes)
+            if cvList.count("V") == 1:
+                return phonemes[cvList.index("V")]
+            return None
+
+        for phonemes in [
+            [],
+            ["p", "ɹ", "k"],
+            ["ˌɑɪ"],
+            ["p", "ˌɑɪ", "n", "z"],
+            ["p", "ˈɔ", "ɹ", "k"],
+            ["s", "t", "ɹ", "ˈɛ", "ŋ", "k", "θ", "s"],
+            ["k", "n̩"],
+            ["ɚ", "z"],
+        ]:
+            sut = phonetics.Syllable(phonemes)
+
+            self.assertEqual(listBasedCvList(phonemes), sut.cvList)
+            self.assertEqual(listBasedNucleus(phonemes), sut.nucleus)
+
+            # The stressed vowel of a syllable is its nucleus
+            stressedVowelIndicies = phonetics.Syllabification.new(
+                [phonemes]
+            ).stressedVowelIndicies
+            if sut.hasStress:
+                self.assertEqual(
+                    [listBasedCvList(phonemes).index("V")], stressedVowelIndicies
+                )
+
+    def test_vowel_bitmask_with_two_vowels(self):
+        phonemes = ["m", "ˈa", "ə", "n"]
+        with self.assertRaises(errors.TooManyVowelsInSyllableError) as cm:
+            phonetics.Syllable(phonemes)
+
+        self.assertEqual(["C", "V", "V", "C"], cm.exception.syllableCVMapped)
+
+    def test_with_suffix(self):
+        sut = phonetics.Syllable(["k", "ˈæ", "t"]).withSuffix(["s"])
+
+        self.assertEqual(["k", "ˈæ", "t", "s"], sut.phonemes)
+        self.assertEqual(["C", "V", "C", "C"], sut.cvList)
+        self.assertEqual("ˈæ", sut.nucleus)
+
+    def test_with_suffix_cannot_add_a_second_vowel(self):
+        with self.assertRaises(errors.TooManyVowelsInSyllableError) as cm:
+            phonetics.Syllable(["b", "ˈʌ", "s"]).withSuffix(["ɪ", "z"])
+
+        self.assertEqual(["C", "V", "C", "V", "C"], cm.exception.syllableCVMapped)
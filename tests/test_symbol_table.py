@@ -0,0 +1,65 @@
+import unittest
+
+from pysle import phonetics
+from pysle.utilities import isle_io
+from pysle.utilities import symbol_table
+
+
+class TestPhonemeSymbolTable(unittest.TestCase):
+    def test_codes_round_trip(self):
+        sut = symbol_table.PhonemeSymbolTable(["k", "æ", "t"])
+
+        codes = sut.encode(["k", "ˈæ", "t", "k"])
+
+        self.assertEqual([0, 3, 2, 0], list(codes))
+        self.assertEqual("H", codes.typecode)
+        self.assertEqual(["k", "ˈæ", "t", "k"], sut.decode(codes))
+        self.assertEqual(4, len(sut))
+
+    def test_intern_returns_the_tables_copy_of_each_symbol(self):
+        sut = symbol_table.PhonemeSymbolTable([])
+        first = sut.intern(["".join(["t", "˺"])])
+        second = sut.intern(["".join(["t", "˺"])])
+
+        self.assertIs(first[0], second[0])
+
+    def test_parsed_pronunciations_are_interned(self):
+        entryA = isle_io.parseIslePronunciation("cat", "cat(nn) # k ˈæ t #")
+        entryB = isle_io.parseIslePronunciation("tack", "tack(nn) # t ˈæ k #")
+
+        self.assertIs(
+            entryA["syllabificationList"][0][0][1],
+            entryB["syllabificationList"][0][0][1],
+        )
+
+    def test_phoneme_list_codes(self):
+        sut = phonetics.PhonemeList(["k", "æ", "t"])
+
+        self.assertEqual(sut.phonemes, symbol_table.phonemeTable.decode(sut.codes))
+
+    def test_phoneme_list_codes_do_not_grow_the_table(self):
+        numSymbols = len(symbol_table.phonemeTable)
+        sut = phonetics.PhonemeList(["k", "not a phoneme", "t"])
+
+        self.assertEqual(symbol_table.UNKNOWN_CODE, sut.codes[1])
+        self.assertEqual(numSymbols, len(symbol_table.phonemeTable))
+        self.assertNotIn("not a phoneme", symbol_table.phonemeTable)
+
+    def test_encode_without_adding_missing_symbols(self):
+        sut = symbol_table.PhonemeSymbolTable(["k", "æ", "t"])
+
+        codes = sut.encode(["k", "ˈæ", "t"], addMissing=False)
+
+        self.assertEqual([0, symbol_table.UNKNOWN_CODE, 2], list(codes))
+        self.assertEqual(symbol_table.UNKNOWN_CODE, sut.lookupCode("ˈæ"))
+        self.assertEqual(3, len(sut))
+
+    def test_intern_keeps_working_when_the_table_is_full(self):
+        sut = symbol_table.PhonemeSymbolTable(
+            str(i) for i in range(symbol_table.MAX_NUM_SYMBOLS)
+        )
+
+        self.assertEqual(["k", "7"], sut.intern(["k", "7"]))
+        self.assertNotIn("k", sut)
+        with self.assertRaises(ValueError):
+            sut.getCode("k")
@@ -0,0 +1,32 @@
+import random
+import unittest
+
+from pysle.utilities import utils
+
+
+class TestLongestCommonSubsequence(unittest.TestCase):
+    def test_lcs(self):
+        self.assertEqual(
+            ["a", "d"],
+            utils.getLongestCommonSubsequence(
+                ["l", "a", "z", "d", "u"], ["a", "b", "c", "d", "e", "f"]
+            ),
+        )
+        self.assertEqual([], utils.getLongestCommonSubsequence([], ["a"]))
+        self.assertEqual([], utils.getLongestCommonSubsequence(["a"], ["b"]))
+
+    def test_table_and_hirschberg_break_ties_the_same_way(self):
+        rng = random.Random(0)
+        for _ in range(2000):
+            alphabet = "abcd"[: rng.randint(1, 4)]
+            xs = [rng.choice(alphabet) for _ in range(rng.randint(0, 12))]
+            ys = [rng.choice(alphabet) for _ in range(rng.randint(0, 12))]
+
+            self.assertEqual(utils._lcs(xs, ys), utils._lcsTable(xs, ys))
+
+    def test_long_sequences_use_hirschberg(self):
+        xs = list("abcab") * 120
+        ys = list("bacba") * 120
+
+        self.assertGreater(len(xs) * len(ys), utils.LCS_TABLE_MAX_CELLS)
+        self.assertEqual(utils._lcs(xs, ys), utils.getLongestCommonSubsequence(xs, ys))
@@ -1,7 +1,16 @@
+import os
+import shutil
+import tempfile
 import unittest
+from unittest import mock
 
 import pytest
 
+from pysle.utilities import constants
+
+root = os.path.dirname(os.path.realpath(__file__))
+dataRoot = os.path.join(root, "files")
+
 
 class _DecoratedMethodsClass(type):
     def __new__(cls, name, bases, local):
@@ -16,3 +25,28 @@ class _DecoratedMethodsClass(type):
 # will be run but their runs will not be included in test coverage
 class CoverageIgnoredTest(unittest.TestCase, metaclass=_DecoratedMethodsClass):
     pass
+
+
+def copyIsleSample(testCase: unittest.TestCase) -> str:
+    """Copies the sample isle dictionary into a temporary directory
+
+    Until the test finishes, files derived from the copy are saved in a
+    second temporary directory instead of the user's cache directory.  Both
+    directories are removed when the test finishes.
+
+    Returns:
+        the path to the copy
+    """
+    tmpDir = tempfile.mkdtemp()
+    testCase.addCleanup(shutil.rmtree, tmpDir, ignore_errors=True)
+
+    cacheDir = tempfile.mkdtemp()
+    testCase.addCleanup(shutil.rmtree, cacheDir, ignore_errors=True)
+    patcher = mock.patch.dict(os.environ, {constants.CACHE_DIR_ENV_VAR: cacheDir})
+    patcher.start()
+    testCase.addCleanup(patcher.stop)
+
+    islePath = os.path.join(tmpDir, "isle.txt")
+    shutil.copy(os.path.join(dataRoot, "isle_sample.txt"), islePath)
+
+    return islePath